@@ -1,29 +1,45 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from cachetools import LRUCache
 from fastapi import Depends, HTTPException, Header, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import AsyncSessionLocal, SessionLocal
 from ..models.user import User
+from ..services.firebase_service import get_firebase_service, firebase_uid_to_uuid
 import uuid
 
+# User IDs known to exist in the users table (process-local)
+_known_user_ids = LRUCache(maxsize=50_000)
+
 
 def get_db_session() -> Generator[Session, None, None]:
     """Dependency for database session."""
-    db = next(get_db())
-    try:
+    with SessionLocal() as db:
+        yield db
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for an async database session (for `async def` endpoints)."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Phase 2: Role-based authentication dependencies
 # Note: This is a simplified POC implementation
 # In production, use proper JWT/OAuth authentication
 
-async def get_current_user_id(
-    authorization: str = Header(None, description="Firebase ID Token")
+async def _ensure_user_id(
+    authorization: str = Header(None, description="Firebase ID Token"),
+    db: Session = Depends(get_db_session)
 ) -> uuid.UUID:
     """
-    Extract user ID from Firebase ID Token.
+    Resolve the Firebase ID Token to a user ID, registering the user on first sight.
+
+    Uses the request-scoped session so the registration shares a connection with
+    the rest of the request; its blocking calls run in the threadpool. Users
+    already seen by this process skip the DB entirely.
     """
     if not authorization or not authorization.startswith("Bearer "):
         # For POC/Demo, still allow X-User-Id as fallback
@@ -42,9 +58,8 @@ async def get_current_user_id(
         )
 
     id_token = authorization.split("Bearer ")[1]
-    from ..services.firebase_service import firebase_service
     
-    decoded_token = firebase_service.verify_token(id_token)
+    decoded_token, _ = await get_firebase_service().verify_token_cached(id_token)
     if not decoded_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,48 +74,55 @@ async def get_current_user_id(
     name = decoded_token.get("name", "Firebase User")
 
     try:
-        # Try to use a deterministic UUID based on Firebase UID if it's not a UUID
-        if len(firebase_uid) != 36: # Simple check for UUID length
-            # Generate a namespace UUID
-            import hashlib
-            m = hashlib.md5()
-            m.update(firebase_uid.encode('utf-8'))
-            user_id = uuid.UUID(m.hexdigest())
-        else:
-            user_id = uuid.UUID(firebase_uid)
-            
-        # Register user if they don't exist
-        db = next(get_db())
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                user = User(
-                    id=user_id,
-                    name=name,
-                    email=email,
-                    role="super_admin" # Default for POC
-                )
-                db.add(user)
-                db.commit()
-        finally:
-            db.close()
-            
-        return user_id
+        # Deterministic UUID based on Firebase UID (memoized per UID)
+        user_id = firebase_uid_to_uuid(firebase_uid)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID mapping from Firebase"
         )
 
+    # Register user if they don't exist
+    if user_id not in _known_user_ids:
+        def register_user() -> None:
+            db.execute(
+                pg_insert(User)
+                .values(
+                    id=user_id,
+                    name=name,
+                    email=email,
+                    role="super_admin" # Default for POC
+                )
+                .on_conflict_do_nothing(index_elements=[User.id])
+            )
+            db.commit()
+
+        # Sync session I/O; keep it off the event loop
+        await run_in_threadpool(register_user)
+        _known_user_ids[user_id] = True
+
+    return user_id
+
+
+async def get_current_user_id(
+    user_id: uuid.UUID = Depends(_ensure_user_id)
+) -> uuid.UUID:
+    """
+    Extract user ID from Firebase ID Token.
+    """
+    return user_id
+
 
 async def get_current_user(
-    user_id: uuid.UUID = Depends(get_current_user_id),
+    user_id: uuid.UUID = Depends(_ensure_user_id),
     db: Session = Depends(get_db_session)
 ) -> User:
     """Get current user from database."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     if not user:
+        # Deleted since this process last saw it; re-register on the next request
+        _known_user_ids.pop(user_id, None)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
@@ -1,77 +1,79 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-import contextvars
+from typing import Optional
 import uuid
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
+from ..services.firebase_service import get_firebase_service, firebase_uid_to_uuid
 
 logger = logging.getLogger(__name__)
 
-# ContextVar to hold current user ID globally
-user_id_context = contextvars.ContextVar("user_id", default=None)
-
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+class AuthenticationMiddleware:
     """
-    Middleware to extract X-User-Id and set it in contextvars for global access.
+    Middleware to extract the caller's identity and store it on request.state.user_id.
     Acts as a foundational layer for RBAC by ensuring identity is propagated.
+
+    Implemented as a plain ASGI callable: headers are read straight from the
+    scope and the downstream app runs in the same task.
     """
-    
-    async def dispatch(self, request: Request, call_next):
-        auth_header = request.headers.get("Authorization")
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = None
+        x_user_id = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+            elif name == b"x-user-id":
+                x_user_id = value.decode("latin-1")
+
         user_id = None
+        verified = False
         
         if auth_header and auth_header.startswith("Bearer "):
             token_str = auth_header.split("Bearer ")[1]
-            from ..services.firebase_service import firebase_service
-            decoded_token = firebase_service.verify_token(token_str)
+            decoded_token, token_verified = await get_firebase_service().verify_token_cached(token_str)
             if decoded_token:
                 # Map Firebase UID to UUID like in deps.py
                 firebase_uid = decoded_token.get("uid")
                 try:
-                    import uuid
-                    if len(firebase_uid) != 36:
-                        import hashlib
-                        m = hashlib.md5()
-                        m.update(firebase_uid.encode('utf-8'))
-                        user_id = str(uuid.UUID(m.hexdigest()))
-                    else:
-                        user_id = str(uuid.UUID(firebase_uid))
+                    user_id = str(firebase_uid_to_uuid(firebase_uid))
+                    # Dev-fallback (unsigned) decodes still identify, but never verify
+                    verified = token_verified
                 except:
                     logger.warning(f"Middleware: Could not map Firebase UID {firebase_uid} to UUID")
 
         # Fallback to X-User-Id for POC compatibility during migration
-        if not user_id:
-            x_user_id = request.headers.get("X-User-Id")
-            if x_user_id:
-                # Apply same MD5 hashing logic as deps.py to convert Firebase UID to UUID
-                try:
-                    import uuid
-                    import hashlib
-                    if len(x_user_id) == 36:
-                        # It's already a UUID format
-                        user_id = str(uuid.UUID(x_user_id))
-                    else:
-                        # Firebase UID - hash it to create deterministic UUID
-                        m = hashlib.md5()
-                        m.update(x_user_id.encode('utf-8'))
-                        user_id = str(uuid.UUID(m.hexdigest()))
-                except Exception as e:
-                    logger.warning(f"Middleware: Could not convert X-User-Id '{x_user_id}' to UUID: {e}")
-
-        token = None
-        if user_id:
+        if not user_id and x_user_id:
+            # Apply same UID -> UUID mapping as deps.py
             try:
-                token = user_id_context.set(user_id)
+                user_id = str(firebase_uid_to_uuid(x_user_id))
             except Exception as e:
-                logger.warning(f"Middleware: Could not set user context: {e}")
-        
-        try:
-            response = await call_next(request)
-            return response
-        finally:
-            if token:
-                user_id_context.reset(token)
+                logger.warning(f"Middleware: Could not convert X-User-Id '{x_user_id}' to UUID: {e}")
+
+        if user_id:
+            # Copy rather than mutate: the server may share the lifespan state dict
+            scope["state"] = {**scope.get("state", {}), "user_id": user_id, "user_verified": verified}
+
+        await self.app(scope, receive, send)
 
-def get_global_user_id():
-    """Access the global user ID from context."""
-    return user_id_context.get()
+def get_global_user_id(request: Request) -> Optional[str]:
+    """Dependency returning the user ID resolved by AuthenticationMiddleware, if any."""
+    return getattr(request.state, "user_id", None)
+
+
+def get_verified_user_id(request: Request) -> Optional[uuid.UUID]:
+    """
+    The caller's user ID if it came from a verified Firebase token.
+
+    Unlike get_global_user_id, identities taken from the unauthenticated
+    X-User-Id fallback are ignored.
+    """
+    if not getattr(request.state, "user_verified", False):
+        return None
+    return uuid.UUID(request.state.user_id)
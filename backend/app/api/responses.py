@@ -0,0 +1,16 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+import orjson
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson serializes datetimes, UUIDs and large nested lists several times
+    faster than the stdlib encoder. Kept local (rather than fastapi.responses.
+    ORJSONResponse) so it works the same across FastAPI versions.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
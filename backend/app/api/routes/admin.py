@@ -5,16 +5,18 @@ Super admin endpoints for dynamic rule generation and management.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, tuple_
 from typing import List, Optional
+from datetime import datetime
 import uuid
 import os
 import tempfile
 import logging
 
 from ...models.user import User
-from ...models.rule import Rule
+from ...models.rule import Rule, RuleSeverity
 from ...schemas.rule import (
     RuleResponse,
     RuleCreate,
@@ -31,12 +33,25 @@ from ...schemas.rule_preview import (
     DraftRule
 )
 from ...services.rule_generator_service import rule_generator_service
-from ..deps import get_db_session, require_super_admin
+from ..deps import get_async_db_session, get_db_session, require_super_admin
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB; uploads are streamed to disk, never read whole
+
+# Guideline file extension -> content_type understood by the parser
+_CONTENT_TYPE_MAP = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.html': 'html',
+    '.htm': 'html',
+    '.md': 'markdown',
+    '.markdown': 'markdown'
+}
+_ALLOWED_EXTS = frozenset(_CONTENT_TYPE_MAP)
+
 
 @router.post(
     "/rules/generate",
@@ -67,31 +82,22 @@ async def generate_rules_from_document(
     logger.info(f"Rule generation request from user {current_user.id}: {document_title}")
 
     # Validate file type
-    allowed_extensions = {'.pdf', '.docx', '.html', '.htm', '.md', '.markdown'}
     file_ext = os.path.splitext(file.filename)[1].lower()
 
-    if file_ext not in allowed_extensions:
+    if file_ext not in _ALLOWED_EXTS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {file_ext}. Allowed: {allowed_extensions}"
+            detail=f"Unsupported file type: {file_ext}. Allowed: {', '.join(sorted(_ALLOWED_EXTS))}"
         )
 
     # Map file extension to content type
-    content_type_map = {
-        '.pdf': 'pdf',
-        '.docx': 'docx',
-        '.html': 'html',
-        '.htm': 'html',
-        '.md': 'markdown',
-        '.markdown': 'markdown'
-    }
-    content_type = content_type_map.get(file_ext, 'html')
+    content_type = _CONTENT_TYPE_MAP.get(file_ext, 'html')
 
     # Save uploaded file temporarily
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                temp_file.write(chunk)
             temp_file_path = temp_file.name
 
         logger.info(f"Saved uploaded file to: {temp_file_path}")
@@ -150,31 +156,22 @@ async def preview_rules_from_document(
     logger.info(f"Rule preview request from user {current_user.id}: {document_title}")
 
     # Validate file type
-    allowed_extensions = {'.pdf', '.docx', '.html', '.htm', '.md', '.markdown'}
     file_ext = os.path.splitext(file.filename)[1].lower()
 
-    if file_ext not in allowed_extensions:
+    if file_ext not in _ALLOWED_EXTS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {file_ext}. Allowed: {allowed_extensions}"
+            detail=f"Unsupported file type: {file_ext}. Allowed: {', '.join(sorted(_ALLOWED_EXTS))}"
         )
 
     # Map file extension to content type
-    content_type_map = {
-        '.pdf': 'pdf',
-        '.docx': 'docx',
-        '.html': 'html',
-        '.htm': 'html',
-        '.md': 'markdown',
-        '.markdown': 'markdown'
-    }
-    content_type = content_type_map.get(file_ext, 'html')
+    content_type = _CONTENT_TYPE_MAP.get(file_ext, 'html')
 
     # Save uploaded file temporarily
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                temp_file.write(chunk)
             temp_file_path = temp_file.name
 
         logger.info(f"Saved uploaded file for preview to: {temp_file_path}")
@@ -340,11 +337,13 @@ async def list_rules(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     category: Optional[str] = Query(None, description="Filter by category (irdai, brand, seo)"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
+    severity: Optional[RuleSeverity] = Query(None, description="Filter by severity"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, description="Search in rule text"),
+    keyword: Optional[str] = Query(None, description="Only rules tagged with this exact keyword"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (keyset paging)"),
     current_user: User = Depends(require_super_admin),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Get paginated list of all compliance rules.
@@ -356,38 +355,60 @@ async def list_rules(
     - severity: critical, high, medium, or low
     - is_active: true or false
     - search: Text search in rule_text
+    - keyword: Exact match against the rule's keywords (GIN-indexed)
 
-    **Pagination**: Uses page and page_size parameters
+    **Pagination**: Uses page and page_size parameters. For deep lists pass the
+    returned `next_cursor` as `cursor` instead of incrementing `page`; it seeks
+    on (created_at, id) rather than scanning past every earlier row.
     """
     # Build query
-    query = db.query(Rule)
+    query = select(Rule)
 
     # Apply filters
     if category:
-        query = query.filter(Rule.category == category)
+        query = query.where(Rule.category == category)
     if severity:
-        query = query.filter(Rule.severity == severity)
+        query = query.where(Rule.severity == severity)
     if is_active is not None:
-        query = query.filter(Rule.is_active == is_active)
+        query = query.where(Rule.is_active == is_active)
     if search:
-        query = query.filter(Rule.rule_text.ilike(f"%{search}%"))
+        query = query.where(Rule.rule_text.ilike(f"%{search}%"))
+    if keyword:
+        query = query.where(Rule.keywords.contains([keyword]))
 
     # Get total count
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # Calculate pagination
     total_pages = (total + page_size - 1) // page_size
     offset = (page - 1) * page_size
 
-    # Get paginated rules
-    rules = query.order_by(Rule.created_at.desc()).offset(offset).limit(page_size).all()
+    # Keyset pagination: continue strictly after the last row of the previous page
+    if cursor:
+        try:
+            created_at, _, rule_id = cursor.rpartition("_")
+            cursor_key = (datetime.fromisoformat(created_at), uuid.UUID(rule_id))
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        query = query.where(tuple_(Rule.created_at, Rule.id) < cursor_key)
+        offset = 0
+
+    # Get paginated rules (id breaks ties between rules created in one batch)
+    rules = (await db.scalars(
+        query.order_by(Rule.created_at.desc(), Rule.id.desc()).offset(offset).limit(page_size)
+    )).all()
+
+    next_cursor = None
+    if len(rules) == page_size and rules[-1].created_at is not None:
+        next_cursor = f"{rules[-1].created_at.isoformat()}_{rules[-1].id}"
 
     return RuleListResponse(
         rules=[RuleResponse.from_orm(rule) for rule in rules],
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor
     )
 
 
@@ -399,14 +420,14 @@ async def list_rules(
 async def get_rule(
     rule_id: uuid.UUID,
     current_user: User = Depends(require_super_admin),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Get detailed information about a specific rule.
 
     **Requires**: super_admin role
     """
-    rule = db.query(Rule).filter(Rule.id == rule_id).first()
+    rule = await db.get(Rule, rule_id)
 
     if not rule:
         raise HTTPException(
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from pydantic import BaseModel
 import uuid
 import logging
-import json
 import asyncio
+import hashlib
+import math
+import orjson
+from datetime import datetime, timezone
+from ...config import settings
 from ...database import get_db
 from ...models.compliance_check import ComplianceCheck
 from ...models.violation import Violation
@@ -19,12 +24,56 @@ from ...schemas.deep_analysis import (
     DeepAnalysisResponse,
     SeverityWeights
 )
-from ...services.deep_analysis_service import deep_analysis_service
+from ...services.deep_analysis_service import deep_analysis_service, quantize_score
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/compliance", tags=["compliance"])
 
+# Classified results are coalesced into a single write every SSE_BATCH_SIZE
+# lines or SSE_FLUSH_INTERVAL seconds, whichever comes first.
+SSE_BATCH_SIZE = 8
+SSE_FLUSH_INTERVAL = 0.25
+
+
+# Static body for GET .../deep-analyze/presets, built once at import
+_PRESETS_RESPONSE = {
+    "presets": {
+        "strict": {
+            "critical": 2.0,
+            "high": 1.5,
+            "medium": 1.0,
+            "low": 0.5,
+            "description": "Harsh penalties - suitable for final review"
+        },
+        "balanced": {
+            "critical": 1.5,
+            "high": 1.0,
+            "medium": 0.5,
+            "low": 0.2,
+            "description": "Standard weighting - recommended default"
+        },
+        "lenient": {
+            "critical": 1.0,
+            "high": 0.5,
+            "medium": 0.2,
+            "low": 0.1,
+            "description": "Reduced penalties - good for initial drafts"
+        }
+    }
+}
+
+_PRESETS_BODY = orjson.dumps(_PRESETS_RESPONSE)
+_PRESETS_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.blake2b(_PRESETS_BODY, digest_size=8).hexdigest()}"',
+}
+
+
+def _sse(payload: dict) -> bytes:
+    """Encode a payload as a single Server-Sent Events frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 
 @router.get("/{submission_id}", response_model=ComplianceCheckResponse)
 def get_compliance_results(
@@ -32,6 +81,7 @@ def get_compliance_results(
     db: Session = Depends(get_db)
 ):
     """Get compliance check results for a submission."""
+    # Violations are selectin-loaded with the check (see ComplianceCheck.violations)
     check = db.query(ComplianceCheck).filter(
         ComplianceCheck.submission_id == submission_id
     ).first()
@@ -39,25 +89,8 @@ def get_compliance_results(
     if not check:
         raise HTTPException(404, "No compliance check found for this submission")
 
-    # Load violations
-    violations = db.query(Violation).filter(Violation.check_id == check.id).all()
-
-    response = ComplianceCheckResponse(
-        id=check.id,
-        submission_id=check.submission_id,
-        overall_score=float(check.overall_score),
-        irdai_score=float(check.irdai_score),
-        brand_score=float(check.brand_score),
-        seo_score=float(check.seo_score),
-        status=check.status,
-        grade=check.grade,
-        ai_summary=check.ai_summary,
-        check_date=check.check_date,
-        has_deep_analysis=True if check.deep_analysis else False,
-        violations=[ViolationResponse.from_orm(v) for v in violations]
-    )
-
-    return response
+    # Serialized once by response_model (from_attributes), violations included
+    return check
 
 
 class ResumeRequest(BaseModel):
@@ -101,29 +134,13 @@ async def resume_compliance_check(
              # If it finished but returned None (unlikely given logic), handle
              raise HTTPException(status_code=500, detail="Unknown error resuming check")
 
-        # Load violations for response
-        violations = db.query(Violation).filter(Violation.check_id == check.id).all()
-
-        response = ComplianceCheckResponse(
-            id=check.id,
-            submission_id=check.submission_id,
-            overall_score=float(check.overall_score),
-            irdai_score=float(check.irdai_score),
-            brand_score=float(check.brand_score),
-            seo_score=float(check.seo_score),
-            status=check.status,
-            grade=check.grade,
-            ai_summary=check.ai_summary,
-            check_date=check.check_date,
-            has_deep_analysis=True if check.deep_analysis else False,
-            violations=[ViolationResponse.from_orm(v) for v in violations]
-        )
-        return response
+        # Serialized once by response_model (from_attributes), violations included
+        return check
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Resume failed: {str(e)}")
+        logger.error("Resume failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Resume failed: {str(e)}")
 
 
@@ -140,9 +157,7 @@ def get_violations(
     if not check:
         raise HTTPException(404, "No compliance check found")
 
-    violations = db.query(Violation).filter(Violation.check_id == check.id).all()
-
-    return violations
+    return check.violations
 
 
 @router.get("/{submission_id}/interim-results", response_model=ComplianceCheckResponse)
@@ -197,7 +212,7 @@ async def run_deep_analysis(
     - 1.0 = Standard weight
     - 2.0+ = Harsh penalties
     """
-    logger.info(f"Deep analysis requested for submission {submission_id}")
+    logger.info("Deep analysis requested for submission %s", submission_id)
     
     try:
         result = await deep_analysis_service.run_deep_analysis(
@@ -210,7 +225,7 @@ async def run_deep_analysis(
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        logger.error(f"Deep analysis failed: {str(e)}")
+        logger.error("Deep analysis failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Deep analysis failed: {str(e)}"
@@ -253,7 +268,7 @@ async def get_deep_analysis_results(
     "/{submission_id}/deep-analyze/presets",
     summary="Get severity weight presets"
 )
-async def get_severity_presets():
+async def get_severity_presets(request: Request):
     """
     Get predefined severity weight presets for quick configuration.
     
@@ -261,32 +276,12 @@ async def get_severity_presets():
     - **strict**: Harsh penalties for all violations
     - **balanced**: Standard weighting
     - **lenient**: Reduced penalties, good for initial review
+
+    The body is pre-serialized at import; conditional GETs get a 304.
     """
-    return {
-        "presets": {
-            "strict": {
-                "critical": 2.0,
-                "high": 1.5,
-                "medium": 1.0,
-                "low": 0.5,
-                "description": "Harsh penalties - suitable for final review"
-            },
-            "balanced": {
-                "critical": 1.5,
-                "high": 1.0,
-                "medium": 0.5,
-                "low": 0.2,
-                "description": "Standard weighting - recommended default"
-            },
-            "lenient": {
-                "critical": 1.0,
-                "high": 0.5,
-                "medium": 0.2,
-                "low": 0.1,
-                "description": "Reduced penalties - good for initial drafts"
-            }
-        }
-    }
+    if request.headers.get("if-none-match") == _PRESETS_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_PRESETS_HEADERS)
+    return Response(content=_PRESETS_BODY, media_type="application/json", headers=_PRESETS_HEADERS)
 
 
 @router.post(
@@ -295,7 +290,8 @@ async def get_severity_presets():
 )
 async def stream_deep_analysis(
     submission_id: uuid.UUID,
-    request: DeepAnalysisRequest,
+    payload: DeepAnalysisRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -303,52 +299,77 @@ async def stream_deep_analysis(
     
     Returns Server-Sent Events (SSE) with:
     - progress: Current progress percentage
-    - current_line: The line being analyzed
     - last_result: The last classified chunk with score
-    - status: 'processing', 'complete', 'error'
+    - status: 'started', 'classified', 'complete', 'error'
+
+    Classified frames are flushed in batches (see SSE_BATCH_SIZE). If the
+    client disconnects, outstanding AI calls are cancelled and the record is
+    marked 'failed'.
     """
     
+    def mark_failed():
+        # Need fresh session or rollback if transaction failed
+        db.rollback()
+        failed_check = db.query(ComplianceCheck).filter(ComplianceCheck.submission_id == submission_id).first()
+        if failed_check:
+            failed_record = db.query(DeepAnalysis).filter(DeepAnalysis.check_id == failed_check.id).first()
+            if failed_record:
+                failed_record.status = 'failed'
+                db.commit()
+
     async def generate_events():
         try:
             # Get submission
-            submission = db.query(Submission).filter(
-                Submission.id == submission_id
-            ).first()
+            submission = await run_in_threadpool(
+                lambda: db.query(Submission).options(
+                    undefer(Submission.original_content)  # segmented below, on the loop
+                ).filter(
+                    Submission.id == submission_id
+                ).first()
+            )
             
             if not submission:
-                yield f"data: {json.dumps({'status': 'error', 'message': 'Submission not found'})}\n\n"
+                yield _sse({'status': 'error', 'message': 'Submission not found'})
                 return
             
             # Get check
-            check = db.query(ComplianceCheck).filter(
-                ComplianceCheck.submission_id == submission_id
-            ).first()
+            check = await run_in_threadpool(
+                lambda: db.query(ComplianceCheck).filter(
+                    ComplianceCheck.submission_id == submission_id
+                ).first()
+            )
             
             if not check:
-                yield f"data: {json.dumps({'status': 'error', 'message': 'Compliance check not found'})}\n\n"
+                yield _sse({'status': 'error', 'message': 'Compliance check not found'})
                 return
             
             # Get active rules FOR THIS PROJECT
-            active_rules = db.query(Rule).filter(
-                Rule.is_active == True,
-                Rule.project_id == submission.project_id
-            ).all()
+            active_rules = await run_in_threadpool(
+                lambda: db.query(Rule).filter(
+                    Rule.is_active == True,
+                    Rule.project_id == submission.project_id
+                ).all()
+            )
             
+            # Read before any commit below expires the submission, so later uses
+            # do not lazily reload it on the event loop
+            document_title = submission.title
+
             # Segment document
             content = submission.original_content or ""
             segments = deep_analysis_service.segment_document(content)
             total = len(segments)
             
             if total == 0:
-                yield f"data: {json.dumps({'status': 'complete', 'message': 'No content to analyze', 'total_lines': 0})}\n\n"
+                yield _sse({'status': 'complete', 'message': 'No content to analyze', 'total_lines': 0})
                 return
             
-            severity_weights = request.severity_weights
+            severity_weights = payload.severity_weights
             config_snapshot = severity_weights.model_dump()
             results = []
             
              # Send initial status
-            yield f"data: {json.dumps({'status': 'started', 'total_lines': total, 'document_title': submission.title})}\n\n"
+            yield _sse({'status': 'started', 'total_lines': total, 'document_title': document_title})
             await asyncio.sleep(0.1)
 
             # Create initial record with 'processing' status
@@ -356,87 +377,115 @@ async def stream_deep_analysis(
 
              # Create snapshot of severity config used
             config_snapshot = {
-                "critical": request.severity_weights.critical,
-                "high": request.severity_weights.high,
-                "medium": request.severity_weights.medium,
-                "low": request.severity_weights.low
+                "critical": payload.severity_weights.critical,
+                "high": payload.severity_weights.high,
+                "medium": payload.severity_weights.medium,
+                "low": payload.severity_weights.low
             }
 
-            # Delete existing
-            db.query(DeepAnalysis).filter(DeepAnalysis.check_id == check.id).delete()
-            
-            # Create record
-            deep_record = DeepAnalysis(
-                check_id=check.id,
-                total_lines=total,
-                document_title=submission.title,
-                severity_config_snapshot=config_snapshot,
-                analysis_data=[],
-                status='processing'
-            )
-            db.add(deep_record)
-            db.commit() # Commit to make visible
-            db.refresh(deep_record)
-            
-            # Process each line
-            for i, segment in enumerate(segments):
-                # Send progress update
-                progress = {
-                    'status': 'processing',
-                    'progress': round((i / total) * 100, 1),
-                    'current_index': i + 1,
-                    'total_lines': total,
-                    'current_line': {
-                        'line_number': segment['line_number'],
-                        'content': segment['line_content'][:100] + ('...' if len(segment['line_content']) > 100 else '')
-                    }
-                }
-                yield f"data: {json.dumps(progress)}\n\n"
-                
-                # AI: Detect violations
-                ai_result = await deep_analysis_service.detect_violations_with_ai(
-                    line_content=segment["line_content"],
-                    line_number=segment["line_number"],
-                    document_context=submission.title,
-                    active_rules=active_rules
+            def create_processing_record():
+                # Delete existing
+                db.query(DeepAnalysis).filter(DeepAnalysis.check_id == check.id).delete()
+
+                # Create record
+                record = DeepAnalysis(
+                    check_id=check.id,
+                    total_lines=total,
+                    document_title=document_title,
+                    severity_config_snapshot=config_snapshot,
+                    analysis_data=[],
+                    status='processing'
                 )
-                
-                # Calculate score
-                line_score, impacts = deep_analysis_service.calculate_line_score(
-                    base_score=100.0,
-                    violations=ai_result.get("violations", []),
-                    severity_weights=severity_weights
-                )
-                
-                # Build result
-                line_result = {
-                    "line_number": segment["line_number"],
-                    "line_content": segment["line_content"],
-                    "line_score": round(line_score, 2),
-                    "relevance_context": ai_result.get("relevance_context", ""),
-                    "rule_impacts": [imp.model_dump() for imp in impacts]
-                }
-                results.append(line_result)
-                
-                # Send the classified result
-                classified = {
-                    'status': 'classified',
-                    'progress': round(((i + 1) / total) * 100, 1),
-                    'current_index': i + 1,
-                    'total_lines': total,
-                    'last_result': {
-                        'line_number': segment['line_number'],
-                        'content': segment['line_content'][:150] + ('...' if len(segment['line_content']) > 150 else ''),
-                        'score': round(line_score, 2),
-                        'relevance_context': ai_result.get("relevance_context", "")[:200],
-                        'violations_count': len(impacts)
-                    }
-                }
-                yield f"data: {json.dumps(classified)}\n\n"
+                db.add(record)
+                db.commit() # Commit to make visible
+                db.refresh(record)
+                return record
+
+            deep_record = await run_in_threadpool(create_processing_record)
             
+            # Classify lines concurrently (bounded by settings.ai_concurrency) and
+            # stream each result as it completes; results keep document order.
+            sem = asyncio.Semaphore(settings.ai_concurrency)
+            rules_payload = deep_analysis_service.build_rules_payload(active_rules)
+
+            async def classify(i: int, segment: dict):
+                async with sem:
+                    return i, await deep_analysis_service.detect_violations_with_ai(
+                        line_content=segment["line_content"],
+                        line_number=segment["line_number"],
+                        document_context=document_title,
+                        active_rules=active_rules,
+                        rules_payload=rules_payload
+                    )
+
+            tasks = [asyncio.create_task(classify(i, seg)) for i, seg in enumerate(segments)]
+            results = [None] * total
+            # Running aggregates, so no extra passes over results afterwards
+            score_total, min_score, max_score = 0.0, math.inf, -math.inf
+            pending: list[bytes] = []
+            loop = asyncio.get_running_loop()
+            last_flush = loop.time()
+            try:
+                for done_count, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                    i, ai_result = await next_done
+                    segment = segments[i]
+
+                    if await http_request.is_disconnected():
+                        logger.info("Client disconnected, aborting deep analysis stream for %s", submission_id)
+                        await run_in_threadpool(mark_failed)
+                        return
+
+                    # Calculate score
+                    line_score, impacts = deep_analysis_service.calculate_line_score(
+                        base_score=100.0,
+                        violations=ai_result.get("violations", []),
+                        severity_weights=severity_weights
+                    )
+
+                    line_score = round(line_score, 2)
+                    score_total += line_score
+                    if line_score < min_score:
+                        min_score = line_score
+                    if line_score > max_score:
+                        max_score = line_score
+
+                    # Build result
+                    results[i] = {
+                        "line_number": segment["line_number"],
+                        "line_content": segment["line_content"],
+                        "line_score": line_score,
+                        "relevance_context": ai_result.get("relevance_context", ""),
+                        "rule_impacts": [imp.model_dump() for imp in impacts]
+                    }
+
+                    # Queue the classified result (carries progress as well)
+                    pending.append(_sse({
+                        'status': 'classified',
+                        'progress': round((done_count / total) * 100, 1),
+                        'current_index': done_count,
+                        'total_lines': total,
+                        'last_result': {
+                            'line_number': segment['line_number'],
+                            'content': segment['line_content'][:150] + ('...' if len(segment['line_content']) > 150 else ''),
+                            'score': line_score,
+                            'relevance_context': ai_result.get("relevance_context", "")[:200],
+                            'violations_count': len(impacts)
+                        }
+                    }))
+
+                    now = loop.time()
+                    if len(pending) >= SSE_BATCH_SIZE or now - last_flush >= SSE_FLUSH_INTERVAL:
+                        yield b"".join(pending)
+                        pending.clear()
+                        last_flush = now
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            if pending:
+                yield b"".join(pending)
+
             # Save to database
-            from decimal import Decimal
-            
             # Phase 2: Update original ComplianceCheck with new Deep Analysis scores
             # 1. Collect all violations found during deep analysis
             all_violations = []
@@ -446,7 +495,9 @@ async def stream_deep_analysis(
             # 2. Calculate new scores using ScoringService (standardized logic)
             # Import locally to avoid circular dependencies if any
             from ...services.scoring_service import ScoringService
-            new_scores = ScoringService.calculate_scores(all_violations, db)
+            new_scores = await run_in_threadpool(
+                ScoringService.calculate_scores, all_violations, db
+            )
             
             # 3. Update the ComplianceCheck record
             check.overall_score = new_scores["overall"]
@@ -459,20 +510,21 @@ async def stream_deep_analysis(
             # Log the update
             # logger.info(f"Updated ComplianceCheck {check.id} with Deep Analysis scores: {new_scores}")
             
-            avg_score = sum(r["line_score"] for r in results) / len(results) if results else 0
-            scores = [r["line_score"] for r in results] if results else [0]
-            
+            avg_score = score_total / total
             
             # Update record
-            deep_record.average_score = Decimal(str(round(avg_score, 2)))
-            deep_record.min_score = Decimal(str(round(min(scores), 2)))
-            deep_record.max_score = Decimal(str(round(max(scores), 2)))
+            deep_record.average_score = quantize_score(avg_score)
+            deep_record.min_score = quantize_score(min_score)
+            deep_record.max_score = quantize_score(max_score)
             deep_record.analysis_data = results
             deep_record.status = 'completed'
 
-            db.add(deep_record)
-            db.add(check)  # Ensure check update is tracked
-            db.commit()
+            def persist_results():
+                db.add(deep_record)
+                db.add(check)  # Ensure check update is tracked
+                db.commit()
+
+            await run_in_threadpool(persist_results)
             
             # Send completion
             complete = {
@@ -480,26 +532,19 @@ async def stream_deep_analysis(
                 'progress': 100,
                 'total_lines': total,
                 'average_score': round(avg_score, 2),
-                'min_score': min(scores),
-                'max_score': max(scores)
+                'min_score': min_score,
+                'max_score': max_score
             }
-            yield f"data: {json.dumps(complete)}\n\n"
+            yield _sse(complete)
             
         except Exception as e:
-            logger.error(f"Stream error: {str(e)}")
+            logger.error("Stream error: %s", e, exc_info=True)
             # Attempt to mark as failed
             try:
-                # Need fresh session or rollback if transaction failed
-                db.rollback()
-                failed_check = db.query(ComplianceCheck).filter(ComplianceCheck.submission_id == submission_id).first()
-                if failed_check:
-                    failed_record = db.query(DeepAnalysis).filter(DeepAnalysis.check_id == failed_check.id).first()
-                    if failed_record:
-                        failed_record.status = 'failed'
-                        db.commit()
+                await run_in_threadpool(mark_failed)
             except:
                 pass
-            yield f"data: {json.dumps({'status': 'error', 'message': str(e)})}\n\n"
+            yield _sse({'status': 'error', 'message': str(e)})
     
     return StreamingResponse(
         generate_events(),
@@ -523,6 +568,7 @@ async def export_deep_analysis_report(
     """
     Generate and download a DOCX report for the deep compliance analysis.
     """
+    generated_at = datetime.now(timezone.utc)
     try:
         # Get submission title
         submission = db.query(Submission).filter(Submission.id == submission_id).first()
@@ -598,10 +644,8 @@ async def export_deep_analysis_report(
             
         html_content += "</body></html>"
         
-        from datetime import datetime
-        filename = f"Compliance_Deep_Analysis_{submission_id}_{datetime.now().strftime('%Y%m%d')}.html"
+        filename = f"Compliance_Deep_Analysis_{submission_id}_{generated_at:%Y%m%d}.html"
         
-        from fastapi import Response
         return Response(
             content=html_content,
             media_type="text/html",
@@ -704,15 +748,15 @@ async def sync_deep_analysis_results(
         from ...services.scoring_service import scoring_service
         
         try:
-            logger.info(f"Calculating scores for {len(new_violations)} violations")
-            logger.debug(f"Sample violation: {new_violations[0] if new_violations else 'None'}")
+            logger.info("Calculating scores for %d violations", len(new_violations))
+            logger.debug("Sample violation: %s", new_violations[0] if new_violations else None)
             
             # CRITICAL FIX: The scoring service expects actual Violation objects or dicts with proper structure
             # But new_violations is a list of dicts for insertion. We need to fetch the actual inserted violations.
             # However, we haven't inserted them yet! So we pass the dicts, and scoring service will handle them.
             scores = scoring_service.calculate_scores(new_violations, db)
             
-            logger.info(f"Calculated scores: IRDAI={scores['irdai']}, Brand={scores['brand']}, SEO={scores['seo']}")
+            logger.info("Calculated scores: IRDAI=%s, Brand=%s, SEO=%s", scores['irdai'], scores['brand'], scores['seo'])
             
             check.irdai_score = scores["irdai"]
             check.brand_score = scores["brand"]
@@ -721,7 +765,7 @@ async def sync_deep_analysis_results(
             check.status = scores["status"]
         except Exception as scoring_error:
             # If scoring fails (e.g., due to missing rules), use simple defaults
-            logger.warning(f"Scoring service failed, using defaults: {str(scoring_error)}")
+            logger.warning("Scoring service failed, using defaults: %s", scoring_error)
             violation_count = len(new_violations)
             check.irdai_score = max(0, 100 - (violation_count * 2))
             check.brand_score = max(0, 100 - (violation_count * 2))
@@ -753,5 +797,5 @@ async def sync_deep_analysis_results(
         
     except Exception as e:
         db.rollback()
-        logger.error(f"Sync failed: {str(e)}")
+        logger.error("Sync failed: %s", e, exc_info=True)
         raise HTTPException(500, f"Sync failed: {str(e)}")
@@ -1,10 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from typing import List
 from ...database import get_db
 from ...models.submission import Submission
-from ...models.compliance_check import ComplianceCheck
 from ...schemas.submission import SubmissionResponse
 from ...schemas.dashboard import (
     ComplianceTrendsResponse,
@@ -12,30 +10,19 @@ from ...schemas.dashboard import (
     TopViolationResponse
 )
 from ...services.dashboard_service import dashboard_service
+from ..responses import ORJSONResponse
+from ...config import settings
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
+# Aggregate endpoints are served from a short server-side cache; let proxies/browsers reuse them too
+AGGREGATE_CACHE_CONTROL = f"public, max-age={settings.dashboard_cache_ttl}, stale-while-revalidate=300"
+
 
 @router.get("/stats")
 def get_dashboard_stats(db: Session = Depends(get_db)):
     """Get dashboard statistics."""
-    total_submissions = db.query(func.count(Submission.id)).scalar()
-    pending_count = db.query(func.count(Submission.id)).filter(
-        Submission.status == "pending"
-    ).scalar()
-
-    avg_score = db.query(func.avg(ComplianceCheck.overall_score)).scalar()
-
-    flagged_count = db.query(func.count(ComplianceCheck.id)).filter(
-        ComplianceCheck.status == "flagged"
-    ).scalar()
-
-    return {
-        "total_submissions": total_submissions or 0,
-        "pending_count": pending_count or 0,
-        "avg_compliance_score": round(float(avg_score or 0), 2),
-        "flagged_count": flagged_count or 0
-    }
+    return dashboard_service.get_dashboard_stats(db)
 
 
 
@@ -46,7 +33,8 @@ def get_preprocessing_stats(db: Session = Depends(get_db)):
     Returns:
         JSON with total submissions, chunk counts, and recent activity.
     """
-    return dashboard_service.get_preprocessing_stats(db)
+    # Returned as a response object so the payload skips jsonable_encoder's per-value str() pass
+    return ORJSONResponse(dashboard_service.get_preprocessing_stats(db))
 
 
 @router.get("/recent", response_model=List[SubmissionResponse])
@@ -64,6 +52,7 @@ def get_recent_submissions(
 
 @router.get("/trends", response_model=ComplianceTrendsResponse)
 def get_compliance_trends(
+    response: Response,
     days: int = 30,
     db: Session = Depends(get_db)
 ):
@@ -79,11 +68,12 @@ def get_compliance_trends(
     Returns:
         ComplianceTrendsResponse with dates, scores, and counts arrays
     """
+    response.headers["Cache-Control"] = AGGREGATE_CACHE_CONTROL
     return dashboard_service.get_compliance_trends(db, days)
 
 
 @router.get("/violations-heatmap", response_model=ViolationsHeatmapResponse)
-def get_violations_heatmap(db: Session = Depends(get_db)):
+def get_violations_heatmap(response: Response, db: Session = Depends(get_db)):
     """Get violation distribution by category and severity.
     
     Returns pivoted data in ApexCharts-ready format with:
@@ -93,11 +83,13 @@ def get_violations_heatmap(db: Session = Depends(get_db)):
     Returns:
         ViolationsHeatmapResponse ready for ApexCharts heatmap
     """
+    response.headers["Cache-Control"] = AGGREGATE_CACHE_CONTROL
     return dashboard_service.get_violations_heatmap(db)
 
 
 @router.get("/top-violations", response_model=List[TopViolationResponse])
 def get_top_violations(
+    response: Response,
     limit: int = 5,
     db: Session = Depends(get_db)
 ):
@@ -113,4 +105,5 @@ def get_top_violations(
     Returns:
         List of top violations with description, count, severity, and category
     """
+    response.headers["Cache-Control"] = AGGREGATE_CACHE_CONTROL
     return dashboard_service.get_top_violations(db, limit)
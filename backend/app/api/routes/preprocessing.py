@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
 from ...database import get_db
@@ -142,7 +142,7 @@ async def get_submission_chunks(
     logger.info(f"✅ Served {len(chunks)} REAL token chunks with metadata")
     
     # helper to get timestamp (real or fallback)
-    base_time = submission.submitted_at or datetime.utcnow()
+    base_time = submission.submitted_at or datetime.now(timezone.utc)
     
     return ChunkListResponse(
         submission_id=submission_id,
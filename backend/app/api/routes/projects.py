@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List
 from datetime import datetime
-import shutil
+import hashlib
 import os
-import uuid
+import tempfile
 from ...database import get_db
 from ..deps import get_current_user_id
 from ...services.project_service import ProjectService
@@ -17,6 +20,60 @@ from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Guideline file extension -> content_type alias understood by the parser
+_CONTENT_MAP = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.txt': 'markdown', # Treat txt as markdown/text
+    '.md': 'markdown',
+    '.html': 'html'
+}
+_ALLOWED_EXTS = frozenset(_CONTENT_MAP)
+
+
+def _save_upload(src, upload_dir: str, file_ext: str) -> tuple[str, str]:
+    """
+    Copy an uploaded file to disk in 1MB chunks (blocking).
+
+    The file is stored content-addressed as ``{blake2b}{ext}`` so identical
+    uploads land on the same path. Returns ``(file_path, file_hash)``.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    fd, tmp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    file_hash = hasher.hexdigest()
+    file_path = os.path.join(upload_dir, f"{file_hash}{file_ext}")
+    os.replace(tmp_path, file_path)
+    return file_path, file_hash
+
+
+def _unlink_if_exists(path: str) -> None:
+    """Remove a file, ignoring it if it is already gone (blocking)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _get_project_rule(db: Session, project_id: UUID, rule_id: UUID):
+    """Fetch a rule owned by the project directly or via one of its guidelines."""
+    return db.query(Rule).outerjoin(
+        Guideline, Rule.source_guideline_id == Guideline.id
+    ).filter(
+        Rule.id == rule_id,
+        or_(Rule.project_id == project_id, Guideline.project_id == project_id)
+    ).first()
+
 # ... (ProjectCreate, ProjectResponse models) ...
 
 @router.post("/{project_id}/guidelines")
@@ -28,7 +85,7 @@ async def upload_guideline(
 ):
     """Upload a guideline document and extract rules."""
     service = ProjectService(db)
-    project = service.get_project(project_id)
+    project = await run_in_threadpool(service.get_project, project_id)
     if not project:
          raise HTTPException(status_code=404, detail="Project not found")
     if project.created_by != user_id:
@@ -36,42 +93,80 @@ async def upload_guideline(
 
     # Save file
     file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in ['.pdf', '.docx', '.txt', '.html', '.md']:
+    if file_ext not in _ALLOWED_EXTS:
         raise HTTPException(status_code=400, detail="Unsupported file format")
 
     upload_dir = os.path.join(settings.upload_dir, str(project_id))
     os.makedirs(upload_dir, exist_ok=True)
     
-    file_path = os.path.join(upload_dir, f"{uuid.uuid4()}{file_ext}")
-    
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    file_path, file_hash = await run_in_threadpool(_save_upload, file.file, upload_dir, file_ext)
 
     # Convert extension to content_type alias
-    content_map = {
-        '.pdf': 'pdf',
-        '.docx': 'docx',
-        '.txt': 'markdown', # Treat txt as markdown/text
-        '.md': 'markdown',
-        '.html': 'html'
-    }
-    content_type = content_map.get(file_ext, 'text')
+    content_type = _CONTENT_MAP.get(file_ext, 'text')
+
+    # Create Guideline record, or reuse the one already holding this exact file
+    def get_or_create_guideline() -> tuple[Guideline, bool]:
+        def find_existing():
+            return db.query(Guideline).filter(
+                Guideline.project_id == project_id,
+                Guideline.file_hash == file_hash
+            ).first()
+
+        existing = find_existing()
+        if existing:
+            return existing, False
+
+        guideline = Guideline(
+            project_id=project_id,
+            title=file.filename,
+            file_path=file_path,
+            file_hash=file_hash
+        )
+        db.add(guideline)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent upload of the same file
+            db.rollback()
+            return find_existing(), False
+        db.refresh(guideline)
+        return guideline, True
+
+    guideline, created = await run_in_threadpool(get_or_create_guideline)
+
+    if not created:
+        if guideline.file_path != file_path:
+            # Same bytes under another extension: keep only the file the row references
+            await run_in_threadpool(_unlink_if_exists, file_path)
+
+        # Identical file already uploaded: its rules are linked via source_guideline_id
+        total_rules, active_rules = await run_in_threadpool(
+            lambda: db.query(
+                func.count(Rule.id),
+                func.count(Rule.id).filter(Rule.is_active == True)
+            ).filter(
+                Rule.source_guideline_id == guideline.id
+            ).one()
+        )
+        if total_rules:
+            return {
+                "guideline_id": guideline.id,
+                "filename": guideline.title,
+                "rules_extracted": active_rules,
+                "extraction_success": True,
+                "errors": [],
+                "duplicate": True
+            }
 
-    # Create Guideline record
-    guideline = Guideline(
-        project_id=project_id,
-        title=file.filename,
-        file_path=file_path
-    )
-    db.add(guideline)
-    db.commit()
-    db.refresh(guideline)
+        # The earlier extraction failed or found nothing: run it again on the stored file
+        file_path = guideline.file_path
+        content_type = _CONTENT_MAP.get(os.path.splitext(file_path)[1].lower(), 'text')
 
     # Extract Rules
     result = await rule_generator_service.generate_rules_from_document(
         file_path=file_path,
         content_type=content_type,
-        document_title=file.filename,
+        document_title=guideline.title,
         created_by_user_id=user_id,
         db=db,
         project_id=project_id,
@@ -83,7 +178,8 @@ async def upload_guideline(
         "filename": guideline.title,
         "rules_extracted": result["rules_created"],
         "extraction_success": result["success"],
-        "errors": result["errors"]
+        "errors": result["errors"],
+        "duplicate": not created
     }
 
 from ...schemas.project import ProjectCreate, ProjectResponse, GuidelineResponse, ImproveRulesRequest
@@ -151,44 +247,54 @@ def get_project_guidelines(
     if not project or project.created_by != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Assuming relationship exists, or query manually
-    return db.query(Guideline).filter(Guideline.project_id == project_id).all()
+    # Select only the response columns: skips ORM instrumentation and never
+    # pulls the (potentially large) extracted `content` text
+    return db.query(
+        Guideline.id, Guideline.title, Guideline.created_at
+    ).filter(Guideline.project_id == project_id).order_by(Guideline.created_at.desc()).all()
 
 @router.delete("/{project_id}/guidelines/{guideline_id}")
-def delete_guideline(
+async def delete_guideline(
     project_id: UUID,
     guideline_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     service = ProjectService(db)
-    project = service.get_project(project_id)
+    project = await run_in_threadpool(service.get_project, project_id)
     if not project or project.created_by != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    guideline = db.query(Guideline).filter(
-        Guideline.id == guideline_id,
-        Guideline.project_id == project_id
-    ).first()
+    guideline = await run_in_threadpool(
+        lambda: db.query(Guideline).filter(
+            Guideline.id == guideline_id,
+            Guideline.project_id == project_id
+        ).first()
+    )
 
     if not guideline:
         raise HTTPException(status_code=404, detail="Guideline not found")
 
     # Delete associated file
-    if os.path.exists(guideline.file_path):
+    if guideline.file_path:
         try:
-            os.remove(guideline.file_path)
+            await run_in_threadpool(_unlink_if_exists, guideline.file_path)
         except OSError:
             pass # Log error but continue
 
-    # Soft delete associated rules
-    rules = db.query(Rule).filter(Rule.source_guideline_id == guideline.id).all()
-    for rule in rules:
-        rule.is_active = False
-    
-    # Delete guideline record
-    db.delete(guideline)
-    db.commit()
+    def delete_records():
+        # Soft delete associated rules in one UPDATE (no need to load them)
+        db.query(Rule).filter(
+            Rule.source_guideline_id == guideline.id
+        ).update({Rule.is_active: False}, synchronize_session=False)
+
+        # Delete guideline record; the FK nulls rules.source_guideline_id, keeping the rules
+        db.query(Guideline).filter(
+            Guideline.id == guideline.id
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    await run_in_threadpool(delete_records)
 
     return {"success": True, "message": "Guideline and associated rules deleted"}
 
@@ -201,28 +307,23 @@ async def improve_guideline_rules(
     db: Session = Depends(get_db)
 ):
     service = ProjectService(db)
-    project = service.get_project(project_id)
+    project = await run_in_threadpool(service.get_project, project_id)
     if not project or project.created_by != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    guideline = db.query(Guideline).filter(
-        Guideline.id == guideline_id,
-        Guideline.project_id == project_id
-    ).first()
+    guideline = await run_in_threadpool(
+        lambda: db.query(Guideline).filter(
+            Guideline.id == guideline_id,
+            Guideline.project_id == project_id
+        ).first()
+    )
 
     if not guideline:
         raise HTTPException(status_code=404, detail="Guideline not found")
 
     # Determine content type from file extension
     file_ext = os.path.splitext(guideline.file_path)[1].lower()
-    content_map = {
-        '.pdf': 'pdf',
-        '.docx': 'docx',
-        '.txt': 'markdown',
-        '.md': 'markdown',
-        '.html': 'html'
-    }
-    content_type = content_map.get(file_ext, 'text')
+    content_type = _CONTENT_MAP.get(file_ext, 'text')
 
     # Trigger rule generation with instructions
     result = await rule_generator_service.generate_rules_from_document(
@@ -254,17 +355,7 @@ def delete_project_rule(
     if not project or project.created_by != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    rule = db.query(Rule).filter(
-        Rule.id == rule_id,
-        Rule.project_id == project_id
-    ).first()
-
-    if not rule:
-        # Also check if it's linked via source guideline in this project
-        rule = db.query(Rule).join(Guideline).filter(
-            Rule.id == rule_id,
-            Guideline.project_id == project_id
-        ).first()
+    rule = _get_project_rule(db, project_id, rule_id)
 
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found in this project")
@@ -286,21 +377,11 @@ async def refine_project_rule(
 ):
     """Refine a specific rule using AI instructions."""
     service = ProjectService(db)
-    project = service.get_project(project_id)
+    project = await run_in_threadpool(service.get_project, project_id)
     if not project or project.created_by != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    rule = db.query(Rule).filter(
-        Rule.id == rule_id,
-        Rule.project_id == project_id
-    ).first()
-
-    if not rule:
-        # Check source guideline
-        rule = db.query(Rule).join(Guideline).filter(
-            Rule.id == rule_id,
-            Guideline.project_id == project_id
-        ).first()
+    rule = await run_in_threadpool(_get_project_rule, db, project_id, rule_id)
 
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found in this project")
@@ -318,7 +399,7 @@ async def refine_project_rule(
         rule.rule_text = result["refined_text"]
         if result["refined_keywords"]:
             rule.keywords = result["refined_keywords"]
-        db.commit()
+        await run_in_threadpool(db.commit)
         
         return {
             "success": True,
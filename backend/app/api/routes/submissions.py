@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from sqlalchemy import func, tuple_
+from datetime import datetime
+from typing import List, Optional
 import uuid
 import os
-from ...database import get_db
+import secrets
+import logging
+from ...database import get_db, SessionLocal
 from ...models.submission import Submission
 from ...services.content_parser import content_parser
 from ...services.compliance_engine import compliance_engine
@@ -18,6 +22,21 @@ from ...services.hitl_service import hitl_service
 from ...config import settings
 
 router = APIRouter(prefix="/api/submissions", tags=["submissions"])
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+CONTENT_STREAM_CHUNK_SIZE = 64 * 1024  # characters per streamed piece
+
+# Statuses during which a new analysis request is rejected
+ANALYSIS_IN_PROGRESS = ("preprocessing", "analyzing")
+
+# Accepted upload content types and the extension each is stored under
+_FILE_EXTENSIONS = {
+    "html": ".html",
+    "markdown": ".md",
+    "pdf": ".pdf",
+    "docx": ".docx"
+}
 
 
 @router.post("/upload", response_model=SubmissionResponse)
@@ -31,26 +50,21 @@ async def upload_submission(
     """Upload a new submission."""
     try:
         # Validate content type
-        if content_type not in ["html", "markdown", "pdf", "docx"]:
+        file_extension = _FILE_EXTENSIONS.get(content_type)
+        if file_extension is None:
             raise HTTPException(400, "Invalid content type")
 
         # Create uploads directory if not exists
         os.makedirs(settings.upload_dir, exist_ok=True)
 
         # Save file
-        file_id = uuid.uuid4()
-        file_extension = {
-            "html": ".html",
-            "markdown": ".md",
-            "pdf": ".pdf",
-            "docx": ".docx"
-        }[content_type]
-
+        file_id = secrets.token_hex(16)
         file_path = os.path.join(settings.upload_dir, f"{file_id}{file_extension}")
 
+        # Stream to disk in chunks rather than buffering the whole upload in memory
         with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
         # Parse content
         parsed_content = await content_parser.parse_content(file_path, content_type)
@@ -77,12 +91,19 @@ async def upload_submission(
 
 @router.get("", response_model=List[SubmissionResponse])
 def list_submissions(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     project_id: uuid.UUID = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """List all submissions."""
+    """List all submissions.
+
+    Pass the `X-Next-Cursor` header of a page back as `cursor` to fetch the
+    next page by keyset (submitted_at, id) instead of `skip`, which avoids
+    scanning past every earlier row. `skip` is ignored when `cursor` is given.
+    """
     from ...models.compliance_check import ComplianceCheck
     from ...models.deep_analysis import DeepAnalysis
 
@@ -100,21 +121,39 @@ def list_submissions(
     if project_id:
         query = query.filter(Submission.project_id == project_id)
 
-    results = query.group_by(
+    # Keyset pagination: continue strictly after the last row of the previous page
+    if cursor:
+        try:
+            submitted_at, _, submission_id = cursor.rpartition("_")
+            cursor_key = (datetime.fromisoformat(submitted_at), uuid.UUID(submission_id))
+        except ValueError:
+            raise HTTPException(400, "Invalid cursor")
+        query = query.filter(tuple_(Submission.submitted_at, Submission.id) < cursor_key)
+
+    # id breaks ties between submissions sharing a submitted_at
+    query = query.group_by(
         Submission.id
     ).order_by(
-        Submission.submitted_at.desc()
-    ).offset(skip).limit(limit).all()
+        Submission.submitted_at.desc(), Submission.id.desc()
+    ).limit(limit)
+    if not cursor:
+        # Query refuses filter/group_by once OFFSET is set, so it goes last
+        query = query.offset(skip)
+    results = query.all()
+
+    if len(results) == limit and results[-1][0].submitted_at is not None:
+        last = results[-1][0]
+        response.headers["X-Next-Cursor"] = f"{last.submitted_at.isoformat()}_{last.id}"
 
     # Construct response with flag
-    response = []
+    submissions = []
     for submission, has_deep in results:
         # Pydantic model conversion requires explicit dict or ORM object
         sub_dict = submission.__dict__
         sub_dict["has_deep_analysis"] = has_deep
-        response.append(sub_dict)
+        submissions.append(sub_dict)
 
-    return response
+    return submissions
 
 
 @router.get("/{submission_id}", response_model=SubmissionResponse)
@@ -131,9 +170,84 @@ def get_submission(
     return submission
 
 
+@router.get("/{submission_id}/content")
+def get_submission_content(
+    submission_id: uuid.UUID,
+    db: Session = Depends(get_db)
+):
+    """Stream the parsed text of a submission as text/plain."""
+    row = db.query(Submission.original_content).filter(Submission.id == submission_id).first()
+
+    if not row:
+        raise HTTPException(404, "Submission not found")
+
+    content = row.original_content or ""
+
+    def iter_content():
+        for start in range(0, len(content), CONTENT_STREAM_CHUNK_SIZE):
+            yield content[start:start + CONTENT_STREAM_CHUNK_SIZE]
+
+    return StreamingResponse(iter_content(), media_type="text/plain; charset=utf-8")
+
+
+async def _run_analysis(
+    submission_id: uuid.UUID,
+    db: Session,
+    preprocess: Optional[bool] = None
+) -> None:
+    """Preprocess (if not yet chunked) and run compliance analysis.
+
+    `preprocess` overrides the status-based check, for callers that already
+    moved the submission to `analyzing`.
+    """
+    submission = db.query(Submission).filter(Submission.id == submission_id).first()
+    if not submission:
+        # Deleted between scheduling and running (background runs)
+        logger.warning("Submission %s no longer exists; skipping analysis", submission_id)
+        return
+
+    if preprocess is None:
+        preprocess = submission.status == "uploaded"
+
+    # Auto-preprocess if not yet chunked
+    if preprocess:
+        from ...services.preprocessing_service import PreprocessingService
+        preprocessing_service = PreprocessingService(db)
+
+        await preprocessing_service.preprocess_submission(
+            submission_id=submission_id
+        )
+
+        db.refresh(submission)
+
+    # Run compliance analysis (chunk-aware)
+    await compliance_engine.analyze_submission(str(submission_id), db)
+
+
+async def _run_analysis_in_background(submission_id: uuid.UUID, preprocess: bool) -> None:
+    """Background-task entry point; the request's session is closed by now, so open a fresh one."""
+    db = SessionLocal()
+    try:
+        await _run_analysis(submission_id, db, preprocess=preprocess)
+    except Exception:
+        logger.exception("Background analysis failed for submission %s", submission_id)
+        # Preprocessing/compliance_engine normally mark the failure; make sure the
+        # `analyzing` claim taken by the request never stays stuck
+        db.rollback()
+        db.query(Submission).filter(
+            Submission.id == submission_id,
+            Submission.status.in_(ANALYSIS_IN_PROGRESS)
+        ).update({"status": "failed"}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
 @router.post("/{submission_id}/analyze", response_model=SubmissionAnalyzeResponse)
 async def analyze_submission(
     submission_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
     db: Session = Depends(get_db)
 ):
     """
@@ -143,29 +257,41 @@ async def analyze_submission(
     1. Auto-preprocess if not already chunked
     2. Run compliance analysis on chunks
     3. Return results
+
+    With `background=true` the analysis is scheduled after the response is sent
+    and the call returns immediately with the submission already marked
+    `analyzing` (briefly `preprocessing` while it is chunked); poll
+    `GET /api/submissions/{id}` until the status reaches `analyzed`,
+    `waiting_for_review` or `failed`.
     """
     submission = db.query(Submission).filter(Submission.id == submission_id).first()
 
     if not submission:
         raise HTTPException(404, "Submission not found")
 
-    if submission.status == "analyzing":
+    if submission.status in ANALYSIS_IN_PROGRESS:
         raise HTTPException(400, "Analysis already in progress")
 
+    if background:
+        preprocess = submission.status == "uploaded"
+        # Claim the submission before responding so pollers see `analyzing` and a
+        # second POST is rejected; the conditional UPDATE makes the claim atomic.
+        claimed = db.query(Submission).filter(
+            Submission.id == submission_id,
+            Submission.status.notin_(ANALYSIS_IN_PROGRESS)
+        ).update({"status": "analyzing"}, synchronize_session=False)
+        db.commit()
+        if not claimed:
+            raise HTTPException(400, "Analysis already in progress")
+
+        background_tasks.add_task(_run_analysis_in_background, submission_id, preprocess)
+        return {
+            "message": "Analysis started",
+            "submission_id": submission_id
+        }
+
     try:
-        # Auto-preprocess if status is 'uploaded' (not yet chunked)
-        if submission.status == "uploaded":
-            from ...services.preprocessing_service import PreprocessingService
-            preprocessing_service = PreprocessingService(db)
-            
-            chunks_created = await preprocessing_service.preprocess_submission(
-                submission_id=submission_id
-            )
-            
-            db.refresh(submission)
-        
-        # Run compliance analysis (chunk-aware)
-        await compliance_engine.analyze_submission(str(submission_id), db)
+        await _run_analysis(submission_id, db)
 
         return {
             "message": "Analysis completed",
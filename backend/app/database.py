@@ -1,17 +1,53 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import orjson
 from .config import settings
 
+
+def _json_serializer(obj) -> str:
+    """Encode JSON/JSONB bind values with orjson (e.g. deep_analysis.analysis_data)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine
 engine = create_engine(
     settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connections first
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    echo=settings.environment == "development"
+)
+
+# Async engine for endpoints that query without leaving the event loop
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    connect_args={
+        # Reuse prepared statements (and their plans) for the hot read queries;
+        # asyncpg's own cache plus SQLAlchemy's adapter-level cache, per connection
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    },
+    # The asyncpg dialect registers these as the json/jsonb type codecs on every
+    # new connection, so JSONB columns decode via orjson instead of stdlib json
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=settings.environment == "development"
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
@@ -24,3 +60,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
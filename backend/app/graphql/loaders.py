@@ -0,0 +1,50 @@
+import asyncio
+import uuid
+from collections import defaultdict
+from functools import partial
+from typing import AsyncIterator, List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+from ..models.submission import Submission
+from ..models.rule import Rule
+from ..database import AsyncSessionLocal
+
+
+async def load_submissions_by_project(session: AsyncSession, lock: asyncio.Lock, keys: List[uuid.UUID]) -> List[List[Submission]]:
+    """Batch-load submissions for many projects with one IN (...) query."""
+    async with lock:
+        result = await session.execute(select(Submission).where(Submission.project_id.in_(keys)))
+        grouped = defaultdict(list)
+        for submission in result.scalars():
+            grouped[submission.project_id].append(submission)
+    return [grouped[key] for key in keys]
+
+
+async def load_rules_by_project(session: AsyncSession, lock: asyncio.Lock, keys: List[uuid.UUID]) -> List[List[Rule]]:
+    """Batch-load rules for many projects with one IN (...) query."""
+    async with lock:
+        result = await session.execute(select(Rule).where(Rule.project_id.in_(keys)))
+        grouped = defaultdict(list)
+        for rule in result.scalars():
+            grouped[rule.project_id].append(rule)
+    return [grouped[key] for key in keys]
+
+
+async def get_context() -> AsyncIterator[dict]:
+    """
+    Per-request GraphQL context; loaders must not be shared across requests.
+
+    Runs as a FastAPI yield-dependency, so one AsyncSession serves every
+    resolver in the request and is closed once the response is built.
+    Sibling fields resolve concurrently and an AsyncSession does not allow
+    concurrent operations, so all session access goes through session_lock.
+    """
+    async with AsyncSessionLocal() as session:
+        lock = asyncio.Lock()
+        yield {
+            "session": session,
+            "session_lock": lock,
+            "submissions_by_project": DataLoader(load_fn=partial(load_submissions_by_project, session, lock)),
+            "rules_by_project": DataLoader(load_fn=partial(load_rules_by_project, session, lock)),
+        }
@@ -1,86 +1,99 @@
 import uuid
 from typing import List, Optional
-from sqlalchemy.orm import Session
+import strawberry
+from sqlalchemy import delete, insert, select
 from ..models.project import Project
 from ..models.submission import Submission
 from ..models.rule import Rule
-from ..database import get_db
+from ..models.user import User
 
 class Resolvers:
     @staticmethod
-    def get_projects(info) -> List[Project]:
-        db = next(get_db())
-        try:
-            return db.query(Project).all()
-        finally:
-            db.close()
+    async def get_projects(info: strawberry.Info) -> List[Project]:
+        async with info.context["session_lock"]:
+            result = await info.context["session"].execute(select(Project))
+            return result.scalars().all()
 
     @staticmethod
-    def get_project(info, id: uuid.UUID) -> Optional[Project]:
-        db = next(get_db())
-        try:
-            return db.query(Project).filter(Project.id == id).first()
-        finally:
-            db.close()
+    async def get_project(info: strawberry.Info, id: uuid.UUID) -> Optional[Project]:
+        async with info.context["session_lock"]:
+            return await info.context["session"].get(Project, id)
 
     @staticmethod
-    def get_submissions(info, project_id: Optional[uuid.UUID] = None) -> List[Submission]:
-        db = next(get_db())
-        try:
-            query = db.query(Submission)
-            if project_id:
-                query = query.filter(Submission.project_id == project_id)
-            return query.all()
-        finally:
-            db.close()
+    async def get_submissions(info: strawberry.Info, project_id: Optional[uuid.UUID] = None) -> List[Submission]:
+        if project_id:
+            # Shares the batch with any ProjectType.submissions in the same request
+            return await info.context["submissions_by_project"].load(project_id)
+        async with info.context["session_lock"]:
+            result = await info.context["session"].execute(select(Submission))
+            return result.scalars().all()
 
     @staticmethod
-    def get_rules(info, category: Optional[str] = None) -> List[Rule]:
-        db = next(get_db())
-        try:
-            query = db.query(Rule)
-            if category:
-                query = query.filter(Rule.category == category)
-            return query.all()
-        finally:
-            db.close()
+    async def get_rules(info: strawberry.Info, category: Optional[str] = None) -> List[Rule]:
+        query = select(Rule)
+        if category:
+            query = query.where(Rule.category == category)
+        async with info.context["session_lock"]:
+            result = await info.context["session"].execute(query)
+            return result.scalars().all()
 
     @staticmethod
-    def get_violations(info, submission_id: uuid.UUID) -> List[any]:
+    async def get_violations(info: strawberry.Info, submission_id: uuid.UUID) -> List[any]:
         # This would require common imports or models
+        from ..models.compliance_check import ComplianceCheck
         from ..models.violation import Violation
-        db = next(get_db())
-        try:
-            return db.query(Violation).filter(Violation.submission_id == submission_id).all()
-        finally:
-            db.close()
+        async with info.context["session_lock"]:
+            result = await info.context["session"].execute(
+                select(Violation)
+                .join(ComplianceCheck, Violation.check_id == ComplianceCheck.id)
+                .where(ComplianceCheck.submission_id == submission_id)
+            )
+            return result.scalars().all()
 
     @staticmethod
-    def create_project(info, name: str, description: Optional[str] = None) -> Project:
-        # For authenticated operations, we can check info.context
-        user_id = getattr(info.context.get("request", {}), "user_id", None)
-        # Note: Strawberry FastAPI context might be different, 
-        # normally it's available in info.context["request"]
-        
-        db = next(get_db())
-        try:
-            project = Project(name=name, description=description)
-            db.add(project)
-            db.commit()
-            db.refresh(project)
+    async def create_project(info: strawberry.Info, name: str, description: Optional[str] = None) -> Project:
+        # Only token-verified callers may create projects; the X-User-Id
+        # fallback the middleware still honours is not proof of identity
+        from ..api.middleware import get_verified_user_id
+        user_id = get_verified_user_id(info.context["request"])
+        if user_id is None:
+            raise PermissionError("Authentication required")
+
+        db = info.context["session"]
+        async with info.context["session_lock"]:
+            # Verified tokens are registered on their first REST call; refuse ids
+            # with no users row instead of failing on the created_by foreign key
+            if await db.get(User, user_id) is None:
+                raise PermissionError("Unknown user")
+
+            # INSERT ... RETURNING: one round-trip, no refresh SELECT afterwards
+            result = await db.execute(
+                insert(Project).values(
+                    name=name,
+                    description=description,
+                    created_by=user_id
+                ).returning(Project)
+            )
+            project = result.scalar_one()
+            await db.commit()
             return project
-        finally:
-            db.close()
 
     @staticmethod
-    def delete_project(info, id: uuid.UUID) -> bool:
-        db = next(get_db())
-        try:
-            project = db.query(Project).filter(Project.id == id).first()
-            if project:
-                db.delete(project)
-                db.commit()
-                return True
-            return False
-        finally:
-            db.close()
+    async def delete_project(info: strawberry.Info, id: uuid.UUID) -> bool:
+        from ..api.middleware import get_verified_user_id
+        user_id = get_verified_user_id(info.context["request"])
+        if user_id is None:
+            raise PermissionError("Authentication required")
+
+        # Children (guidelines, rules, submissions) go via ON DELETE CASCADE,
+        # so there is no need to load the project or its collections first.
+        # Only the creator's projects match; anything else reports False.
+        db = info.context["session"]
+        async with info.context["session_lock"]:
+            result = await db.execute(
+                delete(Project)
+                .where(Project.id == id, Project.created_by == user_id)
+                .returning(Project.id)
+            )
+            await db.commit()
+            return result.scalar_one_or_none() is not None
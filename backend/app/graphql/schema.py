@@ -3,27 +3,45 @@ import uuid
 from typing import List, Optional
 from .resolvers import Resolvers
 
-@strawberry.type
-class ProjectType:
-    id: uuid.UUID
-    name: str
-    description: Optional[str]
-
 @strawberry.type
 class SubmissionType:
     id: uuid.UUID
-    filename: str
     status: str
     project_id: Optional[uuid.UUID]
 
+    # Resolved from Submission rows, which store the name as `title`
+    @strawberry.field
+    def filename(self) -> str:
+        return self.title
+
 @strawberry.type
 class RuleType:
     id: uuid.UUID
-    title: str
     category: str
     severity: str
     is_active: bool
 
+    # Resolved from Rule rows, whose text column is `rule_text`
+    @strawberry.field
+    def title(self) -> str:
+        return self.rule_text
+
+@strawberry.type
+class ProjectType:
+    id: uuid.UUID
+    name: str
+    description: Optional[str]
+
+    # Nested lists go through per-request DataLoaders (see loaders.get_context),
+    # so N projects cost one query per field instead of N.
+    @strawberry.field
+    async def submissions(self, info: strawberry.Info) -> List[SubmissionType]:
+        return await info.context["submissions_by_project"].load(self.id)
+
+    @strawberry.field
+    async def rules(self, info: strawberry.Info) -> List[RuleType]:
+        return await info.context["rules_by_project"].load(self.id)
+
 @strawberry.type
 class Query:
     projects: List[ProjectType] = strawberry.field(resolver=Resolvers.get_projects)
@@ -34,11 +52,11 @@ class Query:
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def create_project(self, name: str, description: Optional[str] = None) -> ProjectType:
-        return Resolvers.create_project(None, name, description)
+    async def create_project(self, info: strawberry.Info, name: str, description: Optional[str] = None) -> ProjectType:
+        return await Resolvers.create_project(info, name, description)
 
     @strawberry.mutation
-    def delete_project(self, id: uuid.UUID) -> bool:
-        return Resolvers.delete_project(None, id)
+    async def delete_project(self, info: strawberry.Info, id: uuid.UUID) -> bool:
+        return await Resolvers.delete_project(info, id)
 
 schema = strawberry.Schema(query=Query, mutation=Mutation)
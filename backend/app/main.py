@@ -1,8 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import orjson
 from .config import settings
+from .api.responses import ORJSONResponse
 from .api.routes import submissions, compliance, dashboard, admin, preprocessing, onboarding, projects
 from .services.llm_service import llm_service
 
@@ -20,22 +23,40 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Compliance Agent Backend")
 
-    # Check LLM connection
-    llm_healthy = await llm_service.health_check()
-
-    if llm_healthy:
+    async def check_llm():
+        try:
+            return await llm_service.health_check()
+        except Exception as e:
+            logger.warning(f"LLM health check failed: {e}")
+            return False
+
+    async def warm_orchestrator():
+        # Graph construction is blocking (imports, checkpointer setup), so build
+        # it on a worker thread while the LLM health check is in flight.
+        # Failures are caught here so they never cancel the sibling probe.
+        try:
+            from .services.agents.orchestrator import get_orchestrator
+            return await asyncio.to_thread(get_orchestrator)
+        except ImportError as e:
+            logger.warning(f"Failed to import orchestrator: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize Compliance Graph: {e}")
+        return None
+
+    # Check LLM connection and initialize Graph (warmup) concurrently
+    async with asyncio.TaskGroup() as tg:
+        llm_task = tg.create_task(check_llm())
+        orchestrator_task = tg.create_task(warm_orchestrator())
+
+    if llm_task.result() is True:
         logger.info("✅ LLM service is available")
     else:
         logger.warning("⚠️ LLM service is not available - using fallback responses")
 
-    # Initialize Graph (warmup)
-    try:
-        from .services.agents.orchestrator import orchestrator
+    orchestrator = orchestrator_task.result()
+    if orchestrator is not None:
+        app.state.orchestrator = orchestrator
         logger.info("Compliance Graph initialized")
-    except ImportError as e:
-        logger.warning(f"Failed to import orchestrator: {e}")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Compliance Graph: {e}")
 
     yield
 
@@ -43,12 +64,19 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Compliance Agent Backend")
 
 
+# Interactive docs / OpenAPI schema are only built outside production
+_docs_enabled = settings.environment != "production"
+
 # Create FastAPI app
 app = FastAPI(
     title="Compliance Agent API",
     description="AI-powered compliance checking for marketing content",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    openapi_url="/openapi.json" if _docs_enabled else None,
+    docs_url="/docs" if _docs_enabled else None,
+    redoc_url="/redoc" if _docs_enabled else None
 )
 
 # CORS middleware
@@ -58,24 +86,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the keyset cursor of paged listings
+    expose_headers=["X-Next-Cursor"],
 )
 
 from .api.middleware import AuthenticationMiddleware
 app.add_middleware(AuthenticationMiddleware)
 
-# Include routers
-app.include_router(submissions.router)
-app.include_router(compliance.router)
-app.include_router(dashboard.router)
-app.include_router(admin.router)  # Phase 2: Admin routes for rule management
-app.include_router(preprocessing.router)  # Phase 3: Chunked content processing
-app.include_router(onboarding.router)  # Adaptive Engine: User onboarding
-app.include_router(projects.router)  # Phase 1: Project System
+# Include routers (each exactly once)
+ROUTERS = (
+    submissions.router,
+    compliance.router,
+    dashboard.router,
+    admin.router,  # Phase 2: Admin routes for rule management
+    preprocessing.router,  # Phase 3: Chunked content processing
+    onboarding.router,  # Adaptive Engine: User onboarding
+    projects.router,  # Phase 1: Project System
+)
+for router in ROUTERS:
+    app.include_router(router)
  
 from strawberry.fastapi import GraphQLRouter
 from .graphql.schema import schema
+from .graphql.loaders import get_context as get_graphql_context
 
-graphql_app = GraphQLRouter(schema)
+graphql_app = GraphQLRouter(schema, context_getter=get_graphql_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 
@@ -91,11 +126,15 @@ async def health_check():
     }
 
 
+# Static root payload, serialized once at import
+_ROOT_RESPONSE_JSON = orjson.dumps({
+    "message": "Compliance Agent API",
+    "docs": "/docs",
+    "version": "1.0.0"
+})
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
-    return {
-        "message": "Compliance Agent API",
-        "docs": "/docs",
-        "version": "1.0.0"
-    }
+    return Response(content=_ROOT_RESPONSE_JSON, media_type="application/json")
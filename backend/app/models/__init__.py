@@ -11,9 +11,15 @@ from .guideline import Guideline
 from .agent_execution import AgentExecution
 from .agent_trace import AgentTrace
 from .tool_invocation import ToolInvocation
+from .knowledge_base import KnowledgeBase
+from sqlalchemy.orm import configure_mappers
 
 __all__ = [
     "User", "Submission", "ComplianceCheck", "Violation", "Rule", 
     "DeepAnalysis", "ContentChunk", "UserConfig", "Project", "Guideline",
-    "AgentExecution", "AgentTrace", "ToolInvocation"
+    "AgentExecution", "AgentTrace", "ToolInvocation", "KnowledgeBase"
 ]
+
+# Every mapper is registered above; resolve relationships/backrefs now, once at
+# import (worker boot), instead of lazily inside the first request's ORM query
+configure_mappers()
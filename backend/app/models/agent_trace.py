@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -11,9 +11,14 @@ class AgentTrace(Base):
     for auditability and debugging.
     """
     __tablename__ = "agent_traces"
+    __table_args__ = (
+        # AgentExecution.traces loads by execution_id ordered by created_at
+        Index("ix_agent_traces_execution_id_created_at", "execution_id", "created_at"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    execution_id = Column(UUID(as_uuid=True), ForeignKey('agent_executions.id', ondelete='CASCADE'), index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
+    execution_id = Column(UUID(as_uuid=True), ForeignKey('agent_executions.id', ondelete='CASCADE'))
     
     step_number = Column(String(50), nullable=False) # e.g. "Step 1", "Planning"
     
@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 import uuid
 
@@ -31,7 +31,13 @@ class ComplianceState(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None  # Defaults to created_at (one clock read per new state)
+
+    @model_validator(mode="after")
+    def _default_updated_at(self) -> "ComplianceState":
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+        return self
 
     def transition_to(self, new_step: str):
         """Record transition to a new step."""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, CHAR, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -7,12 +7,27 @@ from ..database import Base
 
 class Guideline(Base):
     __tablename__ = "guidelines"
+    __table_args__ = (
+        # One guideline per distinct file per project (re-uploads are deduplicated)
+        Index("ix_guidelines_project_id_file_hash", "project_id", "file_hash", unique=True),
+        # Project guideline listing, newest first; INCLUDE carries the other
+        # listed columns so the listing is an index-only scan
+        Index(
+            "ix_guidelines_project_id_created_at",
+            "project_id",
+            text("created_at DESC"),
+            postgresql_include=["id", "title"]
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
+    # Both composite indexes above lead with project_id, so no single-column index
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=True)  # Extracted text content
     file_path = Column(String(1000), nullable=True)  # Path to original file
+    file_hash = Column(CHAR(32), nullable=True)  # blake2b-128 hex digest of the original file
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -8,14 +8,17 @@ from ..database import Base
 class Project(Base):
     __tablename__ = "projects"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    owner = relationship("User", backref="projects")
-    guidelines = relationship("Guideline", back_populates="project", cascade="all, delete-orphan")
-    rules = relationship("Rule", back_populates="project", cascade="all, delete-orphan")
-    submissions = relationship("Submission", back_populates="project", cascade="all, delete-orphan")
+    # passive_deletes: children go via the FKs' ON DELETE CASCADE, so deleting a
+    # project doesn't first SELECT every guideline/rule/submission (and theirs)
+    owner = relationship("User", back_populates="projects")
+    guidelines = relationship("Guideline", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    rules = relationship("Rule", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    submissions = relationship("Submission", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
@@ -1,18 +1,45 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, Numeric, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Numeric, ForeignKey, Index, REAL, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from typing import Literal, get_args
 import uuid
 from ..database import Base
 
 
+# Stored as the native rule_severity enum (4 bytes/row instead of a varchar)
+RuleSeverity = Literal["critical", "high", "medium", "low"]
+RULE_SEVERITIES = get_args(RuleSeverity)
+
+
 class Rule(Base):
     __tablename__ = "rules"
+    __table_args__ = (
+        # Serves keyword containment lookups (keywords @> '["..."]');
+        # jsonb_path_ops only supports @> but is smaller and faster than jsonb_ops
+        Index(
+            "ix_rules_keywords_gin",
+            "keywords",
+            postgresql_using="gin",
+            postgresql_ops={"keywords": "jsonb_path_ops"}
+        ),
+        # Rule loading for analysis is always "active rules of project X
+        # [in category Y]"; the partial index skips inactive rules entirely
+        Index(
+            "ix_rules_active_project_category",
+            "project_id",
+            "category",
+            postgresql_where=text("is_active")
+        ),
+        # Admin listing pages newest first on (created_at, id), incl. keyset cursors
+        Index("ix_rules_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
     category = Column(String(20), nullable=False, index=True)  # irdai, brand, seo
     rule_text = Column(Text, nullable=False)
-    severity = Column(String(20), nullable=False, index=True)  # critical, high, medium, low
+    severity = Column(ENUM(*RULE_SEVERITIES, name="rule_severity"), nullable=False, index=True)
     keywords = Column(JSONB)  # Array of keywords
     pattern = Column(String(1000))  # Optional regex
     is_active = Column(Boolean, default=True)
@@ -53,8 +80,9 @@ class Rule(Base):
         nullable=True,
         comment="Source URL or search query used to generate this rule"
     )
+    # Model score, not money: REAL reads back as a plain float instead of a Decimal
     confidence_score = Column(
-        Numeric(3, 2),
+        REAL,
         nullable=True,
         comment="AI confidence in rule extraction (0.0-1.0)"
     )
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 from ..database import Base
@@ -9,10 +9,12 @@ from ..database import Base
 class Submission(Base):
     __tablename__ = "submissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
     title = Column(String(500), nullable=False)
     content_type = Column(String(50), nullable=False)  # html, markdown, pdf, docx
-    original_content = Column(Text)
+    # Deferred: listings never need the (potentially multi-MB) parsed text
+    original_content = deferred(Column(Text))
     file_path = Column(String(1000))
     submitted_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
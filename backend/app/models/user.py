@@ -9,7 +9,8 @@ from ..database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     role = Column(String(50), default="agent")  # agent, reviewer, super_admin
@@ -18,5 +19,8 @@ class User(Base):
     # Phase 2: Relationship to rules created by this user (if super_admin)
     created_rules = relationship("Rule", back_populates="creator", foreign_keys="Rule.created_by")
     
+    # Projects owned by this user (projects.created_by is ON DELETE CASCADE)
+    projects = relationship("Project", back_populates="owner", passive_deletes=True)
+
     # Adaptive Compliance Engine: User configuration
     config = relationship("UserConfig", back_populates="user", uselist=False, cascade="all, delete-orphan")
@@ -1,16 +1,22 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 import uuid
 from ..database import Base
 
 
 class Violation(Base):
     __tablename__ = "violations"
+    __table_args__ = (
+        # Serves every check_id lookup (leading column) plus category rollups
+        Index("ix_violations_check_id_category", "check_id", "category"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=func.gen_random_uuid())
     check_id = Column(UUID(as_uuid=True), ForeignKey("compliance_checks.id", ondelete="CASCADE"))
-    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=True)
+    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=True, index=True)
     severity = Column(String(20), nullable=False)  # critical, high, medium, low
     category = Column(String(20), nullable=False)  # irdai, brand, seo
     description = Column(Text, nullable=False)
@@ -105,6 +105,7 @@ class RuleListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # pass back as `cursor` for keyset paging
 
 
 class RuleGenerationRequest(BaseModel):
@@ -1,13 +1,25 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, get_args
+from pydantic import BaseModel, Field, field_validator
+
+Severity = Literal["critical", "high", "medium", "low"]
+_SEVERITIES = get_args(Severity)
 
 class ExtractedRuleSchema(BaseModel):
     rule_text: str = Field(..., description="Clear, specific compliance requirement")
-    severity: str = Field(..., description="Severity level: critical, high, medium, low")
+    severity: Severity = Field(..., description="Severity level: critical, high, medium, low")
     keywords: List[str] = Field(..., description="List of relevant keywords for matching")
     points_deduction: float = Field(..., description="Points to deduct for violation (critical=-20, high=-10, medium=-5, low=-2)")
     confidence_score: float = Field(..., description="Confidence score between 0.0 and 1.0")
     category: Optional[str] = Field(None, description="Category of the rule (e.g., regulatory, brand, seo)")
 
+    @field_validator("severity", mode="before")
+    @classmethod
+    def normalize_severity(cls, v):
+        # Accept "High" / " critical " from the model; rules.severity is a native enum.
+        # Anything else falls back to medium (as the dict extraction path does)
+        # rather than failing the whole extraction.
+        severity = str(v).strip().lower()
+        return severity if severity in _SEVERITIES else "medium"
+
 class RuleExtractionResult(BaseModel):
     rules: List[ExtractedRuleSchema] = Field(default_factory=list, description="List of extracted rules")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -32,6 +32,18 @@ class SubmissionAnalyzeResponse(BaseModel):
     submission_id: uuid.UUID
 
 
+RESUME_ACTIONS = {"approve", "reject", "reevaluate", "feedback"}
+
+
 class SubmissionResumeRequest(BaseModel):
     action: str
     feedback: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_action(self):
+        # Reject malformed resumes with a 422 before the graph is restored
+        if self.action not in RESUME_ACTIONS:
+            raise ValueError(f"action must be one of: {', '.join(sorted(RESUME_ACTIONS))}")
+        if self.action == "feedback" and not (self.feedback and self.feedback.strip()):
+            raise ValueError("feedback text is required when action is 'feedback'")
+        return self
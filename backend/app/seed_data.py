@@ -1,5 +1,6 @@
 import asyncio
 import uuid
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from .database import SessionLocal, engine, Base
 from .models.user import User
@@ -82,19 +83,16 @@ def seed_data():
                 }
             ]
             
-            for rule_data in seed_rules:
-                rule = Rule(
-                    id=uuid.uuid4(),
-                    category=rule_data["category"],
-                    rule_text=rule_data["rule_text"],
-                    severity=rule_data["severity"],
-                    keywords=rule_data["keywords"],
-                    points_deduction=rule_data["points_deduction"],
-                    is_active=True,
-                    created_by=admin.id,
-                    project_id=project.id
-                )
-                db.add(rule)
+            # Single batched INSERT for all seed rules
+            db.execute(insert(Rule), [
+                {
+                    **rule_data,
+                    "is_active": True,
+                    "created_by": admin.id,
+                    "project_id": project.id
+                }
+                for rule_data in seed_rules
+            ])
             
             db.commit()
             print(f"✅ Created {len(seed_rules)} rules.")
@@ -2,6 +2,7 @@ import logging
 import uuid
 import datetime
 import asyncio
+import time
 from typing import Dict, Any, List
 from langchain_core.messages import AIMessage
 
@@ -17,12 +18,24 @@ from app.models.agent_execution import AgentExecution
 from app.models.tool_invocation import ToolInvocation
 from app.services.agents.agent_factory import AgentFactory
 from app.database import SessionLocal 
+from app.config import settings
 
 # Context
 from .context import GraphContext
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cap on in-flight runs per agent type, so a burst of submissions
+# queues here instead of fanning out into unbounded LLM calls and DB sessions.
+_agent_slots: Dict[str, asyncio.Semaphore] = {}
+
+def _agent_slot(category: str) -> asyncio.Semaphore:
+    """Semaphore bounding concurrent runs of one agent type (created on first use)."""
+    slot = _agent_slots.get(category)
+    if slot is None:
+        slot = _agent_slots.setdefault(category, asyncio.Semaphore(settings.agent_concurrency))
+    return slot
+
 async def preprocess_node(state: ComplianceState):
     """
     Librarian Node: Prepares document chunks.
@@ -122,6 +135,13 @@ async def analysis_node(state: ComplianceState):
 
     # Helper for parallel execution
     async def process_task(category, chunk_data):
+        queued_at = time.perf_counter()
+        async with _agent_slot(category):
+            wait_ms = (time.perf_counter() - queued_at) * 1000
+            logger.debug(f"Agent {category} slot acquired after {wait_ms:.1f}ms")
+            return await run_task(category, chunk_data)
+
+    async def run_task(category, chunk_data):
         chunk_text = chunk_data.get("text", "")
         chunk_index = chunk_data.get("chunk_index")
         chunk_id = chunk_data.get("id")
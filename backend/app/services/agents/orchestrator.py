@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Dict, Any, Optional
 from uuid import UUID
@@ -113,4 +114,12 @@ class ComplianceOrchestrator:
             logger.warning(f"Graph visualization failed: {e}")
             return None
 
-orchestrator = ComplianceOrchestrator()
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> ComplianceOrchestrator:
+    """
+    Process-wide orchestrator, built on first use.
+
+    Compiling the graph and creating the Redis checkpointer is deferred until a
+    workflow actually runs (or the app warms it up), instead of at import time.
+    """
+    return ComplianceOrchestrator()
@@ -3,8 +3,9 @@ import json
 import logging
 import traceback
 import uuid
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timezone
 from langsmith import traceable
 
 from ..models.rule import Rule
@@ -50,7 +51,8 @@ class ComplianceEngine:
             db.commit()
 
             # Initialize Graph Context
-            from .agents.orchestrator import orchestrator
+            from .agents.orchestrator import get_orchestrator
+            orchestrator = get_orchestrator()
             from .agents.graph.context import GraphContext
             
             # Set Context for DB Session
@@ -164,7 +166,8 @@ class ComplianceEngine:
             if not submission:
                 raise ValueError("Submission not found")
                 
-            from .agents.orchestrator import orchestrator
+            from .agents.orchestrator import get_orchestrator
+            orchestrator = get_orchestrator()
             from .agents.graph.context import GraphContext
             
             # Set Context
@@ -226,7 +229,8 @@ class ComplianceEngine:
         Returns a dict structure matching ComplianceCheckResponse.
         """
         try:
-            from .agents.orchestrator import orchestrator
+            from .agents.orchestrator import get_orchestrator
+            orchestrator = get_orchestrator()
             
             config = {"configurable": {"thread_id": str(submission_id)}}
             snapshot = await orchestrator.get_state(config)
@@ -276,7 +280,7 @@ class ComplianceEngine:
                 "status": "waiting_for_review",
                 "grade": scores.get("grade", "F"),
                 "ai_summary": "Analysis paused for human review.",
-                "check_date": datetime.now(),
+                "check_date": datetime.now(timezone.utc),
                 "has_deep_analysis": False,
                 "violations": formatted_violations
             }
@@ -438,7 +442,9 @@ class ComplianceEngine:
         db.add(compliance_check)
         db.flush() # Get ID
 
-        # Save Violations
+        # Save Violations: one batched INSERT (insertmanyvalues) rather than an
+        # ORM unit-of-work INSERT per violation
+        violation_rows = []
         for v_data in state.violations:
             rule_id = v_data.get("rule_id")
             # Basic validation for rule_id being a UUID if present
@@ -450,19 +456,20 @@ class ComplianceEngine:
                 except:
                     pass
 
-            violation = Violation(
-                check_id=compliance_check.id,
-                rule_id=valid_rule_id,
-                severity=v_data.get("severity", "medium"),
-                category=v_data.get("category", "general"),
-                description=v_data.get("description", "No description"),
-                location=v_data.get("location", ""),
-                current_text=v_data.get("current_text", ""),
-                suggested_fix=v_data.get("suggested_fix", ""),
-                is_auto_fixable=v_data.get("auto_fixable", False),
-                violation_metadata=v_data.get("metadata", {})
-            )
-            db.add(violation)
+            violation_rows.append({
+                "check_id": compliance_check.id,
+                "rule_id": valid_rule_id,
+                "severity": v_data.get("severity", "medium"),
+                "category": v_data.get("category", "general"),
+                "description": v_data.get("description", "No description"),
+                "location": v_data.get("location", ""),
+                "current_text": v_data.get("current_text", ""),
+                "suggested_fix": v_data.get("suggested_fix", ""),
+                "is_auto_fixable": v_data.get("auto_fixable", False),
+                "violation_metadata": v_data.get("metadata", {})
+            })
+        if violation_rows:
+            db.execute(insert(Violation), violation_rows)
             
         # Update Submission
         submission = db.query(Submission).filter(Submission.id == state.submission_id).first()
@@ -6,7 +6,9 @@ Used as fallback when web search APIs are unavailable.
 This ensures the system can always generate baseline rules during onboarding.
 """
 
-from typing import Dict, List
+import heapq
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # Fallback compliance knowledge organized by industry
 COMPLIANCE_KNOWLEDGE_BASE: Dict[str, List[Dict[str, str]]] = {
@@ -172,6 +174,12 @@ def get_fallback_knowledge(industry: str) -> List[Dict[str, str]]:
     return knowledge
 
 
+@lru_cache(maxsize=None)
+def _searchable_text(title: str, snippet: str) -> str:
+    """Lower-cased haystack for an item; the knowledge base is static, so build it once."""
+    return f"{title} {snippet}".lower()
+
+
 def search_knowledge_base(query: str, industry: str = None) -> List[Dict[str, str]]:
     """
     Simple keyword-based search through knowledge base (RAG fallback).
@@ -183,6 +191,12 @@ def search_knowledge_base(query: str, industry: str = None) -> List[Dict[str, st
     Returns:
         Relevant knowledge items
     """
+    return list(_search_knowledge_base(query, industry))
+
+
+@lru_cache(maxsize=512)
+def _search_knowledge_base(query: str, industry: str = None) -> Tuple[Dict[str, str], ...]:
+    """Cached search body; the knowledge base is static, so results depend only on the arguments."""
     query_lower = query.lower()
     keywords = query_lower.split()
     
@@ -200,11 +214,11 @@ def search_knowledge_base(query: str, industry: str = None) -> List[Dict[str, st
     # Score each item by keyword matches
     scored_items = []
     for item in knowledge_pool:
-        text = f"{item['title']} {item['snippet']}".lower()
+        text = _searchable_text(item['title'], item['snippet'])
         score = sum(1 for keyword in keywords if keyword in text)
         if score > 0:
             scored_items.append((score, item))
     
-    # Sort by relevance and return
-    scored_items.sort(reverse=True, key=lambda x: x[0])
-    return [item for score, item in scored_items[:10]]
+    # Top 10 by relevance; nlargest keeps the same tie order as a stable sort
+    top_items = heapq.nlargest(10, scored_items, key=lambda x: x[0])
+    return tuple(item for score, item in top_items)
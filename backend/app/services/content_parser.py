@@ -23,16 +23,10 @@ class ContentParser:
     async def parse_content(file_path: str, content_type: str) -> str:
         """Parse content based on type."""
         try:
-            if content_type == "html":
-                return await ContentParser._parse_html(file_path)
-            elif content_type == "markdown":
-                return await ContentParser._parse_markdown(file_path)
-            elif content_type == "pdf":
-                return await ContentParser._parse_pdf(file_path)
-            elif content_type == "docx":
-                return await ContentParser._parse_docx(file_path)
-            else:
+            parser = _PARSERS.get(content_type)
+            if parser is None:
                 raise ValueError(f"Unsupported content type: {content_type}")
+            return await parser(file_path)
 
         except Exception as e:
             logger.error(f"Error parsing {content_type}: {str(e)}")
@@ -125,6 +119,15 @@ class ContentParser:
         return '\n'.join(text)
 
 
+# content_type -> parser, resolved with one dict lookup per call
+_PARSERS = {
+    "html": ContentParser._parse_html,
+    "markdown": ContentParser._parse_markdown,
+    "pdf": ContentParser._parse_pdf,
+    "docx": ContentParser._parse_docx,
+}
+
+
 class ContentParserService:
     """
     Synchronous wrapper for ContentParser.
@@ -1,13 +1,16 @@
 """Dashboard analytics service for aggregated compliance data."""
 from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case, desc, cast, Date
 from sqlalchemy.dialects.postgresql import aggregate_order_by
+from cachetools import TTLCache
 import logging
+import threading
 
 from ..models.compliance_check import ComplianceCheck
 from ..models.violation import Violation
+from ..config import settings
 from ..schemas.dashboard import (
     ComplianceTrendsResponse,
     ViolationsHeatmapResponse,
@@ -40,6 +43,62 @@ class DashboardService:
         "low": "Low"
     }
 
+    def __init__(self):
+        # Aggregates change slowly; successful results are reused for a short TTL.
+        # Endpoints are sync (threadpool), hence the lock.
+        self._cache = TTLCache(maxsize=128, ttl=settings.dashboard_cache_ttl)
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            return self._cache.get(key)
+
+    def _cache_set(self, key, value):
+        with self._cache_lock:
+            self._cache[key] = value
+        return value
+
+    def get_dashboard_stats(self, db: Session) -> Dict[str, Any]:
+        """Get headline dashboard counters.
+        
+        The compliance-check aggregates scan every check and only move when an
+        analysis completes, so they are served from the TTL cache. Submission
+        counts track the live queue and are always read fresh.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Dict with total_submissions, pending_count,
+            avg_compliance_score and flagged_count
+        """
+        from ..models.submission import Submission
+        
+        total_submissions = db.query(func.count(Submission.id)).scalar()
+        pending_count = db.query(func.count(Submission.id)).filter(
+            Submission.status == "pending"
+        ).scalar()
+        
+        cache_key = ("check_stats",)
+        check_stats = self._cache_get(cache_key)
+        if check_stats is None:
+            avg_score = db.query(func.avg(ComplianceCheck.overall_score)).scalar()
+            flagged_count = db.query(func.count(ComplianceCheck.id)).filter(
+                ComplianceCheck.status == "flagged"
+            ).scalar()
+            check_stats = self._cache_set(cache_key, (
+                round(float(avg_score or 0), 2),
+                flagged_count or 0
+            ))
+        avg_compliance_score, flagged_count = check_stats
+        
+        return {
+            "total_submissions": total_submissions or 0,
+            "pending_count": pending_count or 0,
+            "avg_compliance_score": avg_compliance_score,
+            "flagged_count": flagged_count
+        }
+
     def get_compliance_trends(
         self, 
         db: Session, 
@@ -54,9 +113,14 @@ class DashboardService:
         Returns:
             ComplianceTrendsResponse with dates, scores, and counts arrays
         """
+        cache_key = ("trends", days)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Calculate date range
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
             
             # Query daily aggregates
@@ -76,11 +140,11 @@ class DashboardService:
             # If no data, return empty but valid response
             if not daily_stats:
                 logger.info("No compliance data found for trends")
-                return ComplianceTrendsResponse(
+                return self._cache_set(cache_key, ComplianceTrendsResponse(
                     dates=[],
                     scores=[],
                     counts=[]
-                )
+                ))
             
             # Build response arrays
             dates = []
@@ -94,11 +158,11 @@ class DashboardService:
             
             logger.info(f"Retrieved {len(dates)} days of trend data")
             
-            return ComplianceTrendsResponse(
+            return self._cache_set(cache_key, ComplianceTrendsResponse(
                 dates=dates,
                 scores=scores,
                 counts=counts
-            )
+            ))
             
         except Exception as e:
             logger.error(f"Error fetching compliance trends: {str(e)}")
@@ -121,6 +185,11 @@ class DashboardService:
         Returns:
             ViolationsHeatmapResponse with series (severity levels) and categories
         """
+        cache_key = ("heatmap",)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Pivot query using CASE statements
             # Count violations per category for each severity level
@@ -163,10 +232,10 @@ class DashboardService:
             
             logger.info(f"Retrieved heatmap data: {sum(sum(s.data) for s in series)} total violations")
             
-            return ViolationsHeatmapResponse(
+            return self._cache_set(cache_key, ViolationsHeatmapResponse(
                 series=series,
                 categories=categories
-            )
+            ))
             
         except Exception as e:
             logger.error(f"Error fetching violations heatmap: {str(e)}")
@@ -198,6 +267,11 @@ class DashboardService:
         Returns:
             List of TopViolationResponse items
         """
+        cache_key = ("top_violations", limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Group by description and count occurrences
             top_violations = db.query(
@@ -215,7 +289,7 @@ class DashboardService:
             
             if not top_violations:
                 logger.info("No violations found for top violations query")
-                return []
+                return self._cache_set(cache_key, [])
             
             result = [
                 TopViolationResponse(
@@ -228,7 +302,7 @@ class DashboardService:
             ]
             
             logger.info(f"Retrieved top {len(result)} violations")
-            return result
+            return self._cache_set(cache_key, result)
             
         except Exception as e:
             logger.error(f"Error fetching top violations: {str(e)}")
@@ -301,12 +375,13 @@ class DashboardService:
                 elif ctype == 'md':
                     by_content_type['markdown'] = ct_stat.count
 
+            # UUIDs and datetimes stay native; orjson writes them straight into the output buffer
             recent_list = [
                 {
-                    "submission_id": str(item.id),
+                    "submission_id": item.id,
                     "title": item.title,
                     "status": item.status,
-                    "preprocessed_at": item.submitted_at.isoformat() if item.submitted_at else None,
+                    "preprocessed_at": item.submitted_at,
                     "chunks_created": item.chunk_count
                 }
                 for item in recent_activity
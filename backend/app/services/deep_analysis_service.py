@@ -15,12 +15,20 @@ Architecture ensures:
 """
 
 import uuid
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from decimal import Decimal
-from datetime import datetime
+import math
+import orjson
+from cachetools import TTLCache
+from typing import List, Dict, Any, Optional, Tuple
+from decimal import Decimal, ROUND_HALF_UP
+from datetime import datetime, timezone
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from ..config import settings
+
 from ..models.rule import Rule
 from ..models.deep_analysis import DeepAnalysis
 from ..models.compliance_check import ComplianceCheck
@@ -39,6 +47,23 @@ BASE_DEDUCTIONS = {
     "low": -2.0
 }
 
+# AI classifications keyed by a digest of (line, document context, rule set).
+# Severity weights only affect the deterministic scoring step, so re-running
+# deep analysis on unchanged content and rules skips the LLM entirely; editing
+# a rule changes the digest and invalidates its entries naturally. Only
+# successful classifications are stored, and entries expire after a TTL.
+_AI_RESULT_CACHE: TTLCache = TTLCache(maxsize=20_000, ttl=settings.ai_result_cache_ttl)
+# Classifications currently awaiting the LLM, so concurrent identical requests
+# share one call instead of all missing the cache at once.
+_AI_IN_FLIGHT: Dict[bytes, asyncio.Future] = {}
+
+_Q = Decimal("0.01")
+
+
+def quantize_score(value: float) -> Decimal:
+    """Convert a float score to a 2-dp Decimal for the NUMERIC(5,2) columns."""
+    return Decimal(value).quantize(_Q, rounding=ROUND_HALF_UP)
+
 
 class DeepAnalysisService:
     """
@@ -74,15 +99,33 @@ class DeepAnalysisService:
                     "original_line": line
                 })
         
-        logger.info(f"Document segmented into {len(segments)} analyzable lines")
+        logger.info("Document segmented into %d analyzable lines", len(segments))
         return segments
     
+    def build_rules_payload(self, active_rules: List[Rule]) -> Tuple[List[Dict[str, Any]], bytes]:
+        """
+        Prompt-ready rule dicts plus a digest of them.
+
+        The rule set is the same for every line of a document, so callers build
+        this once per analysis and pass it to detect_violations_with_ai instead
+        of re-converting and re-hashing all rules for each line.
+        """
+        rules_data = [{
+            "id": str(r.id),
+            "category": r.category,
+            "rule_text": r.rule_text,
+            "severity": r.severity,
+            "keywords": r.keywords or []
+        } for r in active_rules]
+        return rules_data, hashlib.blake2b(orjson.dumps(rules_data), digest_size=16).digest()
+    
     async def detect_violations_with_ai(
         self,
         line_content: str,
         line_number: int,
         document_context: str,
-        active_rules: List[Rule]
+        active_rules: List[Rule],
+        rules_payload: Optional[Tuple[List[Dict[str, Any]], bytes]] = None
     ) -> Dict[str, Any]:
         """
         Step 2: Use AI for violation DETECTION only.
@@ -94,20 +137,52 @@ class DeepAnalysisService:
         Returns structured JSON, NO scoring.
         """
         # Convert rules to dict format for prompt
-        rules_data = [{
-            "id": str(r.id),
-            "category": r.category,
-            "rule_text": r.rule_text,
-            "severity": r.severity,
-            "keywords": r.keywords or []
-        } for r in active_rules]
-        
-        return await llm_service.analyze_line_for_violations(
-            line_content=line_content,
-            line_number=line_number,
-            document_context=document_context,
-            rules=rules_data
-        )
+        rules_data, rules_digest = rules_payload or self.build_rules_payload(active_rules)
+        
+        cache_key = hashlib.blake2b(
+            orjson.dumps([line_content, document_context]) + rules_digest,
+            digest_size=16
+        ).digest()
+        cached = _AI_RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Coalesce with an identical classification already in flight (e.g. a
+        # repeated disclaimer chunk, or two analyses of the same document)
+        loop = asyncio.get_running_loop()
+        pending = _AI_IN_FLIGHT.get(cache_key)
+        if pending is not None and pending.get_loop() is loop:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The owning request was cancelled; classify it ourselves
+        
+        future = loop.create_future()
+        _AI_IN_FLIGHT[cache_key] = future
+        try:
+            result = await llm_service.analyze_line_for_violations(
+                line_content=line_content,
+                line_number=line_number,
+                document_context=document_context,
+                rules=rules_data
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if _AI_IN_FLIGHT.get(cache_key) is future:
+                del _AI_IN_FLIGHT[cache_key]
+        
+        if result.get("success"):
+            _AI_RESULT_CACHE[cache_key] = result
+        future.set_result(result)
+        return result
     
     def calculate_line_score(
         self,
@@ -169,59 +244,48 @@ class DeepAnalysisService:
         
         Stores results as SINGLE JSON document per submission.
         """
-        logger.info(f"Starting deep analysis for submission {submission_id}")
+        logger.info("Starting deep analysis for submission %s", submission_id)
         
-        # Get submission
-        submission = db.query(Submission).filter(
-            Submission.id == submission_id
-        ).first()
-        
-        if not submission:
-            raise ValueError(f"Submission not found: {submission_id}")
-        
-        # Get compliance check (must exist)
-        check = db.query(ComplianceCheck).filter(
-            ComplianceCheck.submission_id == submission_id
-        ).first()
-        
-        if not check:
-            raise ValueError(f"No compliance check found for submission: {submission_id}")
-        
-        # Get active rules FOR THIS PROJECT
-        active_rules = db.query(Rule).filter(
-            Rule.is_active == True,
-            Rule.project_id == submission.project_id
-        ).all()
-        logger.info(f"Found {len(active_rules)} active rules")
-        
-        # Step 1: Get chunks via ContentRetrievalService (CHUNK-AWARE)
-        content_service = ContentRetrievalService(db)
-        chunks = content_service.get_analyzable_content(submission_id)
+        # Blocking DB lookups run on the threadpool so the event loop stays free
+        submission, check, active_rules, chunks = await run_in_threadpool(
+            self._load_analysis_inputs, submission_id, db
+        )
+        logger.info("Found %d active rules", len(active_rules))
         
         if not chunks:
             logger.warning("No content to analyze")
             return self._build_empty_response(check, submission, severity_weights)
         
-        logger.info(f"Analyzing {len(chunks)} chunk(s) for deep analysis")
+        logger.info("Analyzing %d chunk(s) for deep analysis", len(chunks))
         
         # Store severity config snapshot
         config_snapshot = severity_weights.model_dump()
         
         results = []
         total_score = 0.0
-        
-        # Step 2 & 3: Analyze each chunk (AI + Deterministic scoring)
-        for i, chunk in enumerate(chunks):
-            logger.debug(f"Analyzing chunk {chunk.chunk_index + 1}/{len(chunks)}")
-            
-            # AI: Detect violations (non-deterministic)
-            ai_result = await self.detect_violations_with_ai(
-                line_content=chunk.text,
-                line_number=chunk.chunk_index + 1,  # For prompt compatibility
-                document_context=submission.title,
-                active_rules=active_rules
-            )
-            
+        min_score, max_score = math.inf, -math.inf
+        
+        # Step 2: AI: Detect violations (non-deterministic). Chunks are independent,
+        # so classify them concurrently, bounded by settings.ai_concurrency;
+        # gather keeps results in chunk order.
+        sem = asyncio.Semaphore(settings.ai_concurrency)
+        rules_payload = self.build_rules_payload(active_rules)
+        
+        async def classify(chunk) -> Dict[str, Any]:
+            async with sem:
+                logger.debug("Analyzing chunk %d/%d", chunk.chunk_index + 1, len(chunks))
+                return await self.detect_violations_with_ai(
+                    line_content=chunk.text,
+                    line_number=chunk.chunk_index + 1,  # For prompt compatibility
+                    document_context=submission.title,
+                    active_rules=active_rules,
+                    rules_payload=rules_payload
+                )
+        
+        ai_results = await asyncio.gather(*(classify(chunk) for chunk in chunks))
+        
+        # Step 3: Deterministic scoring per chunk
+        for chunk, ai_result in zip(chunks, ai_results):
             # Python: Calculate score (DETERMINISTIC)
             chunk_score, impacts = self.calculate_line_score(
                 base_score=100.0,
@@ -243,36 +307,79 @@ class DeepAnalysisService:
             }
             results.append(chunk_result)
             total_score += chunk_score
+            rounded = chunk_result["chunk_score"]
+            if rounded < min_score:
+                min_score = rounded
+            if rounded > max_score:
+                max_score = rounded
         
         # Calculate summary stats
-        avg_score = total_score / len(results) if results else 100.0
-        scores = [r["chunk_score"] for r in results]
-        min_score = min(scores) if scores else 100.0
-        max_score = max(scores) if scores else 100.0
-        
-        # Delete existing analysis for this check (if any)
-        db.query(DeepAnalysis).filter(DeepAnalysis.check_id == check.id).delete()
-        
-        # Create single record with all data
-        deep_record = DeepAnalysis(
-            check_id=check.id,
-            total_lines=len(results),  # Field name kept for DB compatibility, but contains chunk count
-            average_score=Decimal(str(round(avg_score, 2))),
-            min_score=Decimal(str(round(min_score, 2))),
-            max_score=Decimal(str(round(max_score, 2))),
-            document_title=submission.title,
-            severity_config_snapshot=config_snapshot,
-            analysis_data=results  # All chunks as JSON array
-        )
-        db.add(deep_record)
-        db.commit()
+        avg_score = total_score / len(results)
+        
+        def persist_record() -> Dict[str, Any]:
+            # Delete existing analysis for this check (if any)
+            db.query(DeepAnalysis).filter(DeepAnalysis.check_id == check.id).delete()
+
+            # Create single record with all data
+            record = DeepAnalysis(
+                check_id=check.id,
+                total_lines=len(results),  # Field name kept for DB compatibility, but contains chunk count
+                average_score=quantize_score(avg_score),
+                min_score=quantize_score(min_score),
+                max_score=quantize_score(max_score),
+                document_title=submission.title,
+                severity_config_snapshot=config_snapshot,
+                analysis_data=results  # All chunks as JSON array
+            )
+            db.add(record)
+            db.commit()
+            # The commit expired the record; reading it here keeps the reload
+            # (for server defaults such as created_at) off the event loop
+            return record.to_response_dict(str(submission_id))
+
+        response = await run_in_threadpool(persist_record)
         
         logger.info(
-            f"Deep analysis complete: {len(results)} chunk(s) stored as single JSON, "
-            f"avg={avg_score:.2f}, min={min_score:.2f}, max={max_score:.2f}"
+            "Deep analysis complete: %d chunk(s) stored as single JSON, "
+            "avg=%.2f, min=%.2f, max=%.2f",
+            len(results), avg_score, min_score, max_score
         )
         
-        return deep_record.to_response_dict(str(submission_id))
+        return response
+    
+    def _load_analysis_inputs(
+        self,
+        submission_id: uuid.UUID,
+        db: Session
+    ) -> tuple[Submission, ComplianceCheck, List[Rule], list]:
+        """Load submission, check, active project rules and chunks (blocking)."""
+        # Get submission
+        submission = db.query(Submission).filter(
+            Submission.id == submission_id
+        ).first()
+        
+        if not submission:
+            raise ValueError(f"Submission not found: {submission_id}")
+        
+        # Get compliance check (must exist)
+        check = db.query(ComplianceCheck).filter(
+            ComplianceCheck.submission_id == submission_id
+        ).first()
+        
+        if not check:
+            raise ValueError(f"No compliance check found for submission: {submission_id}")
+        
+        # Get active rules FOR THIS PROJECT
+        active_rules = db.query(Rule).filter(
+            Rule.is_active == True,
+            Rule.project_id == submission.project_id
+        ).all()
+        
+        # Step 1: Get chunks via ContentRetrievalService (CHUNK-AWARE)
+        content_service = ContentRetrievalService(db)
+        chunks = content_service.get_analyzable_content(submission_id)
+        
+        return submission, check, active_rules, chunks
     
     def _build_empty_response(
         self,
@@ -291,7 +398,7 @@ class DeepAnalysisService:
             "max_score": 100.0,
             "severity_config": severity_weights.model_dump(),
             "lines": [],
-            "analysis_timestamp": datetime.utcnow().isoformat()
+            "analysis_timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     async def get_deep_analysis_results(
@@ -304,18 +411,14 @@ class DeepAnalysisService:
         
         Returns the single JSON document containing all analysis.
         """
-        # Get check
-        check = db.query(ComplianceCheck).filter(
-            ComplianceCheck.submission_id == submission_id
-        ).first()
-        
-        if not check:
-            return None
-        
         # Get deep analysis record (single record per check)
-        record = db.query(DeepAnalysis).filter(
-            DeepAnalysis.check_id == check.id
-        ).first()
+        record = await run_in_threadpool(
+            lambda: db.query(DeepAnalysis).join(
+                ComplianceCheck, DeepAnalysis.check_id == ComplianceCheck.id
+            ).filter(
+                ComplianceCheck.submission_id == submission_id
+            ).first()
+        )
         
         if not record:
             return None
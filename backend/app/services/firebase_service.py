@@ -1,11 +1,104 @@
 import firebase_admin
 from firebase_admin import auth, credentials
+from google.auth import transport
+from cachetools import TTLCache
+import anyio
+import asyncio
+import functools
+import hashlib
 import os
 import logging
-from typing import Optional
+import re
+import time
+import uuid
+from typing import Optional, Tuple
+import redis
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Recently verified tokens, keyed by a digest of the token (the raw JWT is never stored).
+# Entries also carry the token's own `exp` so a cached token never outlives its expiry.
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = asyncio.Lock()
+
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
+
+@functools.lru_cache(maxsize=4096)
+def firebase_uid_to_uuid(firebase_uid: str) -> uuid.UUID:
+    """
+    Map a Firebase UID to the deterministic UUID used as our user ID.
+
+    UUID-shaped UIDs are used as-is; anything else is hashed (MD5, so existing
+    user IDs stay stable).
+    """
+    if _UUID_RE.match(firebase_uid):
+        return uuid.UUID(firebase_uid)
+    return uuid.UUID(bytes=hashlib.md5(firebase_uid.encode('utf-8'), usedforsecurity=False).digest())
+
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class _CachedCertResponse(transport.Response):
+    """Minimal transport.Response for a public-key document served from Redis."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    @property
+    def status(self):
+        return 200
+
+    @property
+    def headers(self):
+        return {}
+
+    @property
+    def data(self):
+        return self._data
+
+
+class RedisCertFetchRequest(transport.Request):
+    """
+    Wraps the token verifier's HTTP request to share Google's public keys via Redis.
+
+    The SDK only caches the key documents per process; with this every worker
+    reuses one fetch until the `Cache-Control: max-age` Google sent expires.
+    Redis errors fall through to the wrapped request.
+    """
+
+    KEY_PREFIX = "firebase:pubkeys:"
+
+    def __init__(self, inner: transport.Request, client: redis.Redis):
+        self._inner = inner
+        self._redis = client
+
+    def __call__(self, url, method="GET", body=None, headers=None, timeout=None, **kwargs):
+        if method != "GET":
+            return self._inner(url, method=method, body=body, headers=headers, timeout=timeout, **kwargs)
+
+        key = self.KEY_PREFIX + url
+        try:
+            cached = self._redis.get(key)
+            if cached:
+                return _CachedCertResponse(cached)
+        except redis.RedisError as e:
+            logger.debug(f"Firebase key cache read failed: {e}")
+
+        response = self._inner(url, method=method, body=body, headers=headers, timeout=timeout, **kwargs)
+        if response.status == 200:
+            match = _MAX_AGE_RE.search(response.headers.get("cache-control", "") or "")
+            if match and int(match.group(1)) > 0:
+                try:
+                    self._redis.set(key, response.data, ex=int(match.group(1)))
+                except redis.RedisError as e:
+                    logger.debug(f"Firebase key cache write failed: {e}")
+        return response
+
+
 class FirebaseService:
     def __init__(self):
         self.app = None
@@ -16,6 +109,7 @@ class FirebaseService:
         # Check if already initialized
         if firebase_admin._apps:
             self.app = firebase_admin.get_app()
+            self._share_public_keys()
             return
 
         # Try to load from environment variable path
@@ -41,11 +135,30 @@ class FirebaseService:
             # especially in dev/POC if Firebase isn't fully configured yet.
             pass
 
-    def verify_token(self, id_token: str) -> Optional[dict]:
-        """Verify Firebase ID token and return decoded claims."""
+        self._share_public_keys()
+
+    def _share_public_keys(self):
+        """Route the ID token verifier's public-key fetches through Redis."""
+        if self.app is None:
+            return
+        try:
+            # No public hook for this; the verifier keeps its HTTP request on `.request`
+            verifier = auth._get_client(self.app)._token_verifier
+            client = redis.Redis.from_url(settings.redis_url, socket_timeout=1, socket_connect_timeout=1)
+            verifier.request = RedisCertFetchRequest(verifier.request, client)
+        except Exception as e:
+            logger.warning(f"Firebase public keys will not be shared via Redis: {e}")
+
+    def verify_token(self, id_token: str) -> Tuple[Optional[dict], bool]:
+        """
+        Verify Firebase ID token and return ``(decoded_claims, verified)``.
+
+        ``verified`` is True only when the Admin SDK checked the signature; the
+        dev fallback below returns unverified claims with ``verified=False``.
+        """
         try:
             decoded_token = auth.verify_id_token(id_token)
-            return decoded_token
+            return decoded_token, True
         except Exception as e:
             logger.warning(f"Invalid Firebase token: {e}")
             
@@ -62,10 +175,46 @@ class FirebaseService:
                         decoded['uid'] = decoded['sub']
                     
                     logger.warning(f"⚠️ Using unverified token decoding (Dev Fallback) for user: {decoded.get('uid')}")
-                    return decoded
+                    return decoded, False
             except Exception as e2:
                 logger.error(f"Failed to decode token unverified: {e2}")
                 
-            return None
+            return None, False
+
+    async def verify_token_cached(self, id_token: str) -> Tuple[Optional[dict], bool]:
+        """
+        Verify Firebase ID token, reusing recent successful verifications.
+
+        Returns ``(decoded_claims, verified)`` like verify_token. Only
+        signature-verified tokens are cached, so a dev-fallback decode is never
+        served as verified.
+        """
+        key = hashlib.blake2b(id_token.encode("utf-8"), digest_size=16).digest()
+        now = time.time()
+
+        async with _token_cache_lock:
+            cached = _token_cache.get(key)
+        if cached is not None:
+            decoded_token, expires_at = cached
+            if now < expires_at:
+                return decoded_token, True
+
+        # Signature check (and occasional public-key fetch) is blocking; keep it off the event loop
+        decoded_token, verified = await anyio.to_thread.run_sync(self.verify_token, id_token)
+        if verified:
+            expires_at = float(decoded_token.get("exp") or now + TOKEN_CACHE_TTL_SECONDS)
+            if expires_at > now:
+                async with _token_cache_lock:
+                    _token_cache[key] = (decoded_token, expires_at)
+        return decoded_token, verified
+
+@functools.lru_cache(maxsize=1)
+def get_firebase_service() -> FirebaseService:
+    """
+    Process-wide Firebase service, built on first use.
 
-firebase_service = FirebaseService()
+    Initializing the Admin SDK (credentials, Redis-backed key fetcher) is
+    deferred until a token is actually verified, instead of happening when
+    any route module imports the auth dependencies.
+    """
+    return FirebaseService()
@@ -4,7 +4,7 @@ from uuid import UUID
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
-from .agents.orchestrator import orchestrator
+from .agents.orchestrator import get_orchestrator
 from .agents.graph.context import GraphContext
 from .compliance_engine import ComplianceEngine
 from ..models.submission import Submission
@@ -36,6 +36,7 @@ class HITLService:
             
         # 1. Setup Config & Context
         config = {"configurable": {"thread_id": str(submission_id)}}
+        orchestrator = get_orchestrator()
         token = GraphContext.set_db_session(db)
         
         try:
@@ -1,10 +1,12 @@
 import json
 import asyncio
+import orjson
 import time
 import os
 from typing import Dict, Any, Optional, List, Type, TypeVar
 from sqlalchemy.orm import Session
 from ..models.tool_invocation import ToolInvocation
+from ..models.rule import RULE_SEVERITIES
 import logging
 from datetime import datetime
 from pydantic import BaseModel, ValidationError
@@ -58,9 +60,14 @@ class LLMService:
         self,
         prompt: str,
         system_prompt: str = None,
-        context: Dict[str, Any] = None
+        context: Dict[str, Any] = None,
+        raise_on_error: bool = False
     ) -> str:
-        """Generate response from LLM."""
+        """Generate response from LLM.
+
+        On failure returns a canned fallback payload, or re-raises when
+        raise_on_error is set (callers that must tell failures apart).
+        """
         messages = self._build_chat_messages(prompt, system_prompt, context)
         
         try:
@@ -78,6 +85,8 @@ class LLMService:
 
         except Exception as e:
             logger.error(f"LLM generation failed: {str(e)}")
+            if raise_on_error:
+                raise
             return self._get_fallback_response(prompt, context)
 
     @traceable(run_type="llm", name="generate_structured_response")
@@ -129,9 +138,8 @@ class LLMService:
                 # Extract token usage from the raw generic response
                 token_usage = 0
                 try:
-                    # Get raw JSON dict
-                    import json # Ensure json is available inside scope if needed, though it's imported at top
-                    raw_data = json.loads(response_wrapper.http_response.text)
+                    # Get raw JSON dict (straight from the body bytes, no str decode)
+                    raw_data = orjson.loads(response_wrapper.http_response.content)
                     
                     if "usageMetadata" in raw_data:
                         token_usage = raw_data["usageMetadata"].get("totalTokenCount", 0)
@@ -389,10 +397,12 @@ Return ONLY the JSON array, no other text.
             validated_rules = []
             for rule in rules_data:
                 if "rule_text" in rule:
+                    # rules.severity is a native enum; normalise free-form LLM output
+                    severity = str(rule.get("severity", "medium")).strip().lower()
                     validated_rules.append({
                         "category": category,
                         "rule_text": rule["rule_text"],
-                        "severity": rule.get("severity", "medium"),
+                        "severity": severity if severity in RULE_SEVERITIES else "medium",
                         "keywords": rule.get("keywords", []),
                         "points_deduction": rule.get("points_deduction", -5.0),
                         "confidence_score": rule.get("confidence_score", 0.7)
@@ -414,6 +424,9 @@ Return ONLY the JSON array, no other text.
     ) -> Dict[str, Any]:
         """
         Analyze a single line for compliance violations.
+
+        The result carries "success": False when the LLM call failed or its
+        reply could not be parsed, so callers never mistake it for a clean line.
         """
         from .prompts.deep_analysis_prompt import (
             build_deep_analysis_prompt,
@@ -432,7 +445,8 @@ Return ONLY the JSON array, no other text.
             # Call LLM
             response_text = await self.generate_response(
                 prompt=prompts["user_prompt"],
-                system_prompt=prompts["system_prompt"]
+                system_prompt=prompts["system_prompt"],
+                raise_on_error=True
             )
             
             # Parse response
@@ -446,7 +460,8 @@ Return ONLY the JSON array, no other text.
             logger.error(f"Error analyzing line {line_number}: {str(e)}")
             return {
                 "relevance_context": "Error during analysis",
-                "violations": []
+                "violations": [],
+                "success": False
             }
 
     async def __aenter__(self):
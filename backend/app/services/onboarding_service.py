@@ -10,6 +10,7 @@ Workflow:
 5. Return onboarding summary
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any
 from uuid import UUID
@@ -67,50 +68,49 @@ class OnboardingService:
         rules_by_category = {}
         all_rules = []
         
-        # Step 1: Search for regulations (with RAG fallback)
-        if "regulatory" in analysis_scope or "irdai" in analysis_scope:
+        # Steps 1-3 are independent (search + LLM extraction per scope), so
+        # they run concurrently and are merged in scope order afterwards.
+        async def regulatory_step():
+            # Step 1: Search for regulations (with RAG fallback)
             logger.info(f"Searching regulations for {industry}")
             search_results = await web_search_service.search_regulations(
                 industry=industry,
                 region=region,
                 max_results=10
             )
+            if not search_results:
+                return None
             
-            if search_results:
-                source = search_results[0].get("source", "rag_fallback")
-                sources_used.append(source)
-                
-                # Generate rules from search results
-                regulatory_rules = await llm_service.generate_rules_from_context(
-                    search_results=search_results,
-                    industry=industry,
-                    scope="regulatory"
-                )
-                
-                all_rules.extend(regulatory_rules)
-                rules_by_category["irdai"] = len(regulatory_rules)
-        
-        # Step 2: Generate brand guidelines (if in scope)
-        if "brand" in analysis_scope:
+            source = search_results[0].get("source", "rag_fallback")
+            
+            # Generate rules from search results
+            regulatory_rules = await llm_service.generate_rules_from_context(
+                search_results=search_results,
+                industry=industry,
+                scope="regulatory"
+            )
+            return "irdai", regulatory_rules, source
+        
+        async def brand_step():
+            # Step 2: Generate brand guidelines (if in scope)
             logger.info("Searching brand guidelines best practices")
             brand_results = await web_search_service.search_brand_guidelines(
                 industry=industry,
                 topics=["tone", "terminology", "visuals"],
                 max_results=5
             )
+            if not brand_results:
+                return None
             
-            if brand_results:
-                brand_rules = await llm_service.generate_rules_from_context(
-                    search_results=brand_results,
-                    industry=industry,
-                    scope="brand"
-                )
-                
-                all_rules.extend(brand_rules)
-                rules_by_category["brand"] = len(brand_rules)
-        
-        # Step 3: SEO rules (always included, industry-agnostic)
-        if "seo" in analysis_scope:
+            brand_rules = await llm_service.generate_rules_from_context(
+                search_results=brand_results,
+                industry=industry,
+                scope="brand"
+            )
+            return "brand", brand_rules, None
+        
+        async def seo_step():
+            # Step 3: SEO rules (always included, industry-agnostic)
             logger.info("Generating SEO rules")
             # Use RAG fallback for SEO (universal best practices)
             from .compliance_knowledge_base import SEO_KNOWLEDGE
@@ -120,9 +120,24 @@ class OnboardingService:
                 industry=industry,
                 scope="seo"
             )
-            
-            all_rules.extend(seo_rules)
-            rules_by_category["seo"] = len(seo_rules)
+            return "seo", seo_rules, None
+        
+        steps = []
+        if "regulatory" in analysis_scope or "irdai" in analysis_scope:
+            steps.append(regulatory_step())
+        if "brand" in analysis_scope:
+            steps.append(brand_step())
+        if "seo" in analysis_scope:
+            steps.append(seo_step())
+        
+        for result in await asyncio.gather(*steps):
+            if result is None:
+                continue
+            category, category_rules, source = result
+            if source:
+                sources_used.append(source)
+            all_rules.extend(category_rules)
+            rules_by_category[category] = len(category_rules)
         
         # Step 4: Store rules in database
         for rule_data in all_rules:
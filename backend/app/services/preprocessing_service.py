@@ -6,9 +6,11 @@ Converts uploaded documents into analyzable chunks stored in database.
 
 from typing import List, Dict, Any, Optional
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 import re
 import logging
+import threading
 
 from ..models.submission import Submission
 from ..models.content_chunk import ContentChunk
@@ -17,6 +19,9 @@ from .content_parser import ContentParserService
 
 logger = logging.getLogger(__name__)
 
+# Regex sentence-split fallback: sentence-ending punctuation, whitespace, capital
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
 
 class ContextEngineeringService:
     """
@@ -27,6 +32,11 @@ class ContextEngineeringService:
     - Prompt assembly and context optimization (Factor 3)
     """
 
+    # Process-wide tokenizer / sentence splitter, loaded lazily by the first instance
+    _model_lock = threading.Lock()
+    _tokenizer_state: Optional[tuple] = None
+    _splitter_state: Optional[tuple] = None
+
     COMPLIANCE_PROMPT_TEMPLATE = """You are a compliance expert for insurance marketing content.
 
 Analyze the following content against the provided compliance rules.
@@ -66,15 +76,10 @@ Analyze the following content against the provided compliance rules.
         self.db = db
         self.content_parser = ContentParserService()
         
-        # Initialize tokenizer with fallback hierarchy
-        self.tokenizer = None
-        self.tokenizer_type = None
-        self._init_tokenizer()
-        
-        # Initialize sentence segmentation
-        self.nlp = None
-        self.sentence_splitter_type = None
-        self._init_sentence_splitter()
+        # Tokenizer and sentence splitter are loaded once per process on first
+        # use and shared by every instance (one is built per request/agent).
+        self.tokenizer, self.tokenizer_type = self._shared_tokenizer()
+        self.nlp, self.sentence_splitter_type = self._shared_sentence_splitter()
 
     def create_compliance_prompts(self, content: str, rules: Dict[str, List[Any]]) -> str:
         """
@@ -110,6 +115,26 @@ Analyze the following content against the provided compliance rules.
             content=truncated_content
         )
     
+    def _shared_tokenizer(self) -> tuple:
+        """Return the process-wide (tokenizer, tokenizer_type), loading it on first call."""
+        cls = type(self)
+        if cls._tokenizer_state is None:
+            with cls._model_lock:
+                if cls._tokenizer_state is None:
+                    self._init_tokenizer()
+                    cls._tokenizer_state = (self.tokenizer, self.tokenizer_type)
+        return cls._tokenizer_state
+
+    def _shared_sentence_splitter(self) -> tuple:
+        """Return the process-wide (nlp, sentence_splitter_type), loading it on first call."""
+        cls = type(self)
+        if cls._splitter_state is None:
+            with cls._model_lock:
+                if cls._splitter_state is None:
+                    self._init_sentence_splitter()
+                    cls._splitter_state = (self.nlp, self.sentence_splitter_type)
+        return cls._splitter_state
+
     def _init_tokenizer(self):
         """Initialize tokenizer with fallback: tiktoken -> transformers -> whitespace."""
         # Try tiktoken (OpenAI tokenizer)
@@ -178,8 +203,7 @@ Analyze the following content against the provided compliance rules.
             return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
         else:
             # Regex fallback: split on sentence-ending punctuation
-            pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-            sentences = re.split(pattern, text)
+            sentences = _SENTENCE_BOUNDARY_RE.split(text)
             return [s.strip() for s in sentences if s.strip()]
     
     def _split_oversized_sentence(
@@ -471,6 +495,7 @@ Analyze the following content against the provided compliance rules.
                 raise ValueError(f"Unsupported content type: {submission.content_type}")
             
             # Store chunks in database with FULL token-based metadata
+            chunk_rows = []
             for idx, chunk_data in enumerate(chunks_data):
                 # Ensure metadata contains all required token-based fields
                 metadata = chunk_data["metadata"]
@@ -481,14 +506,13 @@ Analyze the following content against the provided compliance rules.
                     if field not in metadata:
                         logger.warning(f"Missing metadata field '{field}' in chunk {idx}")
                 
-                chunk = ContentChunk(
-                    submission_id=submission_id,
-                    chunk_index=idx,
-                    text=chunk_data["text"],
-                    token_count=chunk_data["token_count"],
-                    chunk_metadata=metadata  # FULL TOKEN METADATA with all fields
-                )
-                self.db.add(chunk)
+                chunk_rows.append({
+                    "submission_id": submission_id,
+                    "chunk_index": idx,
+                    "text": chunk_data["text"],
+                    "token_count": chunk_data["token_count"],
+                    "chunk_metadata": metadata  # FULL TOKEN METADATA with all fields
+                })
                 
                 # Log first chunk metadata for verification
                 if idx == 0:
@@ -498,6 +522,10 @@ Analyze the following content against the provided compliance rules.
                         f"tokens={metadata.get('start_token')}-{metadata.get('end_token')}"
                     )
             
+            # One batched multi-row INSERT (insertmanyvalues) instead of a flush per ORM object
+            if chunk_rows:
+                self.db.execute(insert(ContentChunk), chunk_rows)
+            
             # Update submission status
             submission.status = "preprocessed"
             self.db.commit()
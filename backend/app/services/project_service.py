@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from uuid import UUID
 from typing import List, Optional
 from ..models.project import Project
@@ -22,7 +22,9 @@ class ProjectService:
 
     def get_user_projects(self, user_id: UUID) -> List[Project]:
         """Get all projects for a user."""
-        return self.db.query(Project).filter(Project.created_by == user_id).all()
+        # Listings only serialize scalar columns; raiseload turns any accidental
+        # per-project relationship access (an N+1) into an immediate error
+        return self.db.query(Project).options(raiseload("*")).filter(Project.created_by == user_id).all()
 
     def get_project(self, project_id: UUID) -> Optional[Project]:
         """Get a specific project."""
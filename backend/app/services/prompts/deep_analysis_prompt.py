@@ -100,14 +100,16 @@ def parse_line_analysis_response(response_text: str) -> dict:
     Parse the LLM response for line analysis.
     
     Returns:
-        dict with 'relevance_context' and 'violations' list
+        dict with 'relevance_context', 'violations' list and 'success'
+        (False when the reply held no usable JSON analysis)
     """
     import json
-    import re
+    import orjson
     
     default_response = {
         "relevance_context": "Unable to analyze this line",
-        "violations": []
+        "violations": [],
+        "success": False
     }
     
     if not response_text:
@@ -115,16 +117,20 @@ def parse_line_analysis_response(response_text: str) -> dict:
     
     try:
         # Try to extract JSON from the response
-        # Sometimes LLM adds text before/after JSON
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if json_match:
-            parsed = json.loads(json_match.group())
+        # Sometimes LLM adds text before/after JSON: take the first '{' through
+        # the last '}' (what r'\{[\s\S]*\}' matched) with two linear scans
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start != -1 and end > start:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError (caught below)
+            parsed = orjson.loads(response_text[start:end + 1])
             
-            # Validate structure
+            # Validate structure: an analysis must at least carry a violations list
+            if not isinstance(parsed, dict) or not isinstance(parsed.get("violations"), list):
+                return default_response
             if "relevance_context" not in parsed:
                 parsed["relevance_context"] = "Context not provided"
-            if "violations" not in parsed:
-                parsed["violations"] = []
+            parsed["success"] = True
             
             return parsed
         
@@ -1,5 +1,7 @@
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
+from cachetools import LRUCache
+import hashlib
 import logging
 import json
 import uuid
@@ -15,8 +17,9 @@ class RuleMatcherService:
     # Minimum confidence threshold for accepting a match
     CONFIDENCE_THRESHOLD = 0.7
     
-    # Cache for violation -> rule_id mappings
-    _match_cache: Dict[str, Optional[uuid.UUID]] = {}
+    # Exact-match cache for violation -> rule_id mappings, bounded so it cannot
+    # grow for the life of the worker
+    _match_cache: LRUCache = LRUCache(maxsize=10_000)
     
     async def match_violation_to_rule(
         self,
@@ -39,8 +42,9 @@ class RuleMatcherService:
         Returns:
             UUID of matched rule, or None if no good match found
         """
-        # Create cache key
-        cache_key = f"{project_id}:{category}:{severity}:{hash(violation_description)}"
+        # Create cache key (sha256 rather than hash(): stable and collision-safe)
+        digest = hashlib.sha256(violation_description.encode("utf-8")).hexdigest()
+        cache_key = f"{project_id}:{category}:{severity}:{digest}"
         
         # Check cache
         if cache_key in self._match_cache:
@@ -92,8 +96,8 @@ class RuleMatcherService:
                 return None
                 
         except Exception as e:
+            # Not cached: a transient LLM/DB failure should not pin a miss
             logger.error(f"Error matching violation to rule: {str(e)}")
-            self._match_cache[cache_key] = None
             return None
     
     def _build_matching_prompt(
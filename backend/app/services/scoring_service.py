@@ -1,3 +1,5 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 import logging
@@ -5,6 +7,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ViolationSummary:
+    """Per-category deduction totals gathered in a single pass over violations."""
+    deductions: Dict[str, float] = field(default_factory=lambda: defaultdict(int))
+    counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    has_critical: bool = False
+
+
 class ScoringService:
     """Calculate compliance scores based on violations."""
 
@@ -50,10 +60,13 @@ class ScoringService:
         # Phase 2: Enrich violations with DB-based point deductions
         enriched_violations = ScoringService._enrich_violations_with_points(violations, db)
 
+        # One pass over violations feeds every category score and the status
+        summary = ScoringService._summarize_violations(enriched_violations)
+
         # Calculate category scores
-        irdai_score = ScoringService._calculate_category_score(enriched_violations, "irdai")
-        brand_score = ScoringService._calculate_category_score(enriched_violations, "brand")
-        seo_score = ScoringService._calculate_category_score(enriched_violations, "seo")
+        irdai_score = ScoringService._calculate_category_score(summary, "irdai")
+        brand_score = ScoringService._calculate_category_score(summary, "brand")
+        seo_score = ScoringService._calculate_category_score(summary, "seo")
 
         # Calculate weighted overall score
         overall_score = (
@@ -66,7 +79,7 @@ class ScoringService:
         grade = ScoringService._get_grade(overall_score)
 
         # Determine status
-        status = ScoringService._get_status(enriched_violations, overall_score)
+        status = ScoringService._get_status(summary, overall_score)
 
         return {
             "overall": max(0.0, min(100.0, round(overall_score, 2))),
@@ -146,41 +159,50 @@ class ScoringService:
         return enriched
 
     @staticmethod
-    def _calculate_category_score(violations: List[Dict], category: str) -> float:
+    def _summarize_violations(violations: List[Dict]) -> ViolationSummary:
+        """
+        Accumulate point deductions per category and detect critical violations.
+
+        Combined categories like "irdai|brand" count towards each of their parts.
+        """
+        summary = ViolationSummary()
+        for violation in violations:
+            severity = violation.get("severity")
+            deduction = violation.get("points_deduction", 0)
+            if severity == "critical":
+                summary.has_critical = True
+
+            for category in set(violation.get("category", "").split("|")):
+                summary.deductions[category] += deduction
+                summary.counts[category] += 1
+                logger.debug(f"Category {category}: +{deduction} points (severity={severity})")
+
+        return summary
+
+    @staticmethod
+    def _calculate_category_score(summary: ViolationSummary, category: str) -> float:
         """
         Calculate score for a specific category.
 
         Phase 2 Update: Now uses the 'points_deduction' field from violations
         instead of looking up severity weights.
         
-        Handles combined categories like "irdai|brand" by checking if the 
-        target category is contained in the violation's category string.
+        Combined categories like "irdai|brand" are split up front by
+        _summarize_violations, so this only reads the category's totals.
         
         IMPORTANT: Uses proportional deduction to prevent scores from going to 0
         when there are many violations.
         """
         base_score = 100.0
 
-        # Filter violations for this category (handles | separated categories)
-        category_violations = []
-        for v in violations:
-            v_category = v.get("category", "")
-            # Check if category matches exactly or is part of a combined category
-            if category == v_category or category in v_category.split("|"):
-                category_violations.append(v)
-
-        if not category_violations:
+        violation_count = summary.counts.get(category, 0)
+        if not violation_count:
             logger.debug(f"Category {category}: No violations, returning 100")
             return 100.0
 
-        # Calculate total deduction
-        total_deduction = 0
-        for violation in category_violations:
-            deduction = violation.get("points_deduction", 0)
-            total_deduction += deduction
-            logger.debug(f"Category {category}: +{deduction} points (severity={violation.get('severity')})")
+        total_deduction = summary.deductions[category]
 
-        logger.info(f"Category {category}: {len(category_violations)} violations, total deduction={total_deduction}")
+        logger.info(f"Category {category}: {violation_count} violations, total deduction={total_deduction}")
 
         # Apply deduction with scaling to prevent zero scores
         # If total deduction > 100, scale it down to max 95 (leave at least 5 points)
@@ -213,12 +235,9 @@ class ScoringService:
             return "F"
 
     @staticmethod
-    def _get_status(violations: List[Dict], overall_score: float) -> str:
+    def _get_status(summary: ViolationSummary, overall_score: float) -> str:
         """Determine compliance status."""
-        # Check for critical violations
-        has_critical = any(v.get("severity") == "critical" for v in violations)
-
-        if has_critical or overall_score < 60:
+        if summary.has_critical or overall_score < 60:
             return "failed"
         elif overall_score < 80:
             return "flagged"
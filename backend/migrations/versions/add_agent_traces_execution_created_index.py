@@ -0,0 +1,34 @@
+"""Promote agent_traces.execution_id index to (execution_id, created_at)
+
+Revision ID: add_agent_traces_exec_created_ix
+Revises: add_guideline_file_hash
+Create Date: 2026-10-16
+
+AgentExecution.traces loads an execution's traces ordered by created_at.
+The composite index serves the filter and the sort in one range scan and
+still covers plain execution_id lookups, so the single-column index is
+dropped.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_agent_traces_exec_created_ix'
+down_revision = 'add_guideline_file_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_agent_traces_execution_id_created_at',
+        'agent_traces',
+        ['execution_id', 'created_at'],
+        postgresql_using='btree'
+    )
+    op.drop_index('ix_agent_traces_execution_id', table_name='agent_traces')
+
+
+def downgrade():
+    op.create_index('ix_agent_traces_execution_id', 'agent_traces', ['execution_id'])
+    op.drop_index('ix_agent_traces_execution_id_created_at', table_name='agent_traces')
@@ -0,0 +1,56 @@
+"""Index compliance_checks.submission_id and violations.rule_id
+
+Revision ID: add_fk_lookup_indexes
+Revises: add_rules_keywords_gin_ix
+Create Date: 2026-10-16
+
+Both are foreign keys that are filtered on but had no index:
+- compliance_checks.submission_id: every results / deep-analysis lookup
+  fetches a submission's check by it, and submission deletes cascade on it.
+- violations.rule_id: deleting a rule has to find referencing violations
+  for the FK check, which was a sequential scan of violations.
+Built CONCURRENTLY so writes are not blocked while they build.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_fk_lookup_indexes'
+down_revision = 'add_rules_keywords_gin_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_compliance_checks_submission_id',
+            'compliance_checks',
+            ['submission_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_violations_rule_id',
+            'violations',
+            ['rule_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_violations_rule_id',
+            table_name='violations',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_compliance_checks_submission_id',
+            table_name='compliance_checks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
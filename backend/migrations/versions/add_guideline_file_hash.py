@@ -0,0 +1,34 @@
+"""Add file_hash to guidelines for upload deduplication
+
+Revision ID: add_guideline_file_hash
+Revises: add_submissions_keyset_index
+Create Date: 2026-10-16
+
+POST /api/projects/{id}/guidelines stores uploads content-addressed and
+reuses the existing guideline (and its generated rules) when the same file
+is uploaded to the same project again. Existing rows keep a NULL hash.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_guideline_file_hash'
+down_revision = 'add_submissions_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('guidelines', sa.Column('file_hash', sa.CHAR(32), nullable=True))
+    op.create_index(
+        'ix_guidelines_project_id_file_hash',
+        'guidelines',
+        ['project_id', 'file_hash'],
+        unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_guidelines_project_id_file_hash', table_name='guidelines')
+    op.drop_column('guidelines', 'file_hash')
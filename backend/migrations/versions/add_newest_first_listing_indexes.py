@@ -0,0 +1,71 @@
+"""Add newest-first listing indexes for guidelines and rules
+
+Revision ID: add_newest_first_listing_ix
+Revises: add_rules_active_partial_ix
+Create Date: 2026-10-16
+
+- guidelines (project_id, created_at DESC): the project guideline listing
+  is now ordered newest first; the composite serves filter + order with no
+  sort step. ix_guidelines_project_id is dropped since both composite
+  guideline indexes lead with project_id.
+- rules (created_at DESC, id DESC): the admin rule listing orders (and
+  keyset-pages) on exactly these columns.
+Built CONCURRENTLY so writes are not blocked.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_newest_first_listing_ix'
+down_revision = 'add_rules_active_partial_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_guidelines_project_id_created_at',
+            'guidelines',
+            ['project_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_rules_created_at_id',
+            'rules',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_guidelines_project_id',
+            table_name='guidelines',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_guidelines_project_id',
+            'guidelines',
+            ['project_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_rules_created_at_id',
+            table_name='rules',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'ix_guidelines_project_id_created_at',
+            table_name='guidelines',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
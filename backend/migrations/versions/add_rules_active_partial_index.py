@@ -0,0 +1,44 @@
+"""Add partial index for active-rule lookups
+
+Revision ID: add_rules_active_partial_ix
+Revises: rules_confidence_score_real
+Create Date: 2026-10-16
+
+Every analysis path loads rules with is_active = true for one project
+(ComplianceEngine/RuleGenerator get_active_rules, deep analysis), and the
+violation rule matcher adds the category. A partial (project_id, category)
+index WHERE is_active serves all of them and leaves deactivated rules out
+of the index. Built CONCURRENTLY so rule writes are not blocked.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_rules_active_partial_ix'
+down_revision = 'rules_confidence_score_real'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rules_active_project_category',
+            'rules',
+            ['project_id', 'category'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_rules_active_project_category',
+            table_name='rules',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,43 @@
+"""Add GIN index on rules.keywords
+
+Revision ID: add_rules_keywords_gin_ix
+Revises: add_agent_traces_exec_created_ix
+Create Date: 2026-10-16
+
+Keyword containment filters (keywords @> '["..."]') otherwise decode the
+JSONB array of every rule. jsonb_path_ops only supports @>, which is the
+only operator used, and gives a smaller index than the default jsonb_ops.
+Built CONCURRENTLY so rule writes are not blocked while it builds.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_rules_keywords_gin_ix'
+down_revision = 'add_agent_traces_exec_created_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_rules_keywords_gin',
+            'rules',
+            ['keywords'],
+            postgresql_using='gin',
+            postgresql_ops={'keywords': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_rules_keywords_gin',
+            table_name='rules',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,39 @@
+"""Add keyset pagination index for submission listing
+
+Revision ID: add_submissions_keyset_index
+Revises: merge_heads_20260111
+Create Date: 2026-10-16
+
+Supports GET /api/submissions, which filters by project_id and pages by
+submitted_at DESC (cursor = last submitted_at of the previous page), and the
+unfiltered listing / dashboard "recent" query ordered by submitted_at DESC.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_submissions_keyset_index'
+down_revision = 'merge_heads_20260111'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_submissions_project_id_submitted_at',
+        'submissions',
+        ['project_id', sa.text('submitted_at DESC')],
+        postgresql_using='btree'
+    )
+    op.create_index(
+        'ix_submissions_submitted_at',
+        'submissions',
+        [sa.text('submitted_at DESC')],
+        postgresql_using='btree'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_submissions_submitted_at', table_name='submissions')
+    op.drop_index('ix_submissions_project_id_submitted_at', table_name='submissions')
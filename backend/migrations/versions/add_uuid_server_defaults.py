@@ -0,0 +1,42 @@
+"""Generate primary-key UUIDs in the database
+
+Revision ID: add_uuid_server_defaults
+Revises: add_fk_lookup_indexes
+Create Date: 2026-10-16
+
+The newer tables (content_chunks, deep_analysis, agent_* ...) already
+default their id to gen_random_uuid(); the original tables relied on the
+ORM's Python-side uuid4. With a server default, Core/bulk inserts and raw
+SQL (COPY, seeding) can omit the id column entirely. gen_random_uuid() is
+built in from PostgreSQL 13. Metadata-only change; no rows are rewritten.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_uuid_server_defaults'
+down_revision = 'add_fk_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+TABLES = (
+    'users',
+    'projects',
+    'guidelines',
+    'rules',
+    'submissions',
+    'compliance_checks',
+    'violations',
+)
+
+
+def upgrade():
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
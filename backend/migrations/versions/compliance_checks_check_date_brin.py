@@ -0,0 +1,58 @@
+"""Replace the compliance_checks.check_date B-tree with a BRIN index
+
+Revision ID: compliance_checks_date_brin
+Revises: guidelines_listing_covering_ix
+Create Date: 2026-10-16
+
+check_date defaults to now() and rows are only ever appended, so the
+column is physically ordered on disk. Its only query is the dashboard
+trends range filter (check_date BETWEEN start AND end); nothing orders by
+it. A BRIN index answers that with a per-block-range min/max lookup at a
+tiny fraction of the B-tree's size and write cost.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'compliance_checks_date_brin'
+down_revision = 'guidelines_listing_covering_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_compliance_checks_check_date_brin',
+            'compliance_checks',
+            ['check_date'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_compliance_checks_check_date',
+            table_name='compliance_checks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_compliance_checks_check_date',
+            'compliance_checks',
+            ['check_date'],
+            postgresql_using='btree',
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_compliance_checks_check_date_brin',
+            table_name='compliance_checks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,51 @@
+"""Make the guideline listing index covering
+
+Revision ID: guidelines_listing_covering_ix
+Revises: rules_severity_native_enum
+Create Date: 2026-10-16
+
+GET /api/projects/{id}/guidelines selects only id, title and created_at,
+filtered by project_id and ordered by created_at DESC. Rebuilding
+ix_guidelines_project_id_created_at with INCLUDE (id, title) lets Postgres
+answer it with an index-only scan (no heap fetch per guideline, and the
+large `content` column is never touched). The new index is built under a
+temporary name first so the listing is never without an index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'guidelines_listing_covering_ix'
+down_revision = 'rules_severity_native_enum'
+branch_labels = None
+depends_on = None
+
+
+def _swap(include):
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_guidelines_project_id_created_at_new',
+            'guidelines',
+            ['project_id', sa.text('created_at DESC')],
+            postgresql_include=include,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_guidelines_project_id_created_at',
+            table_name='guidelines',
+            postgresql_concurrently=True
+        )
+    op.execute(
+        "ALTER INDEX ix_guidelines_project_id_created_at_new "
+        "RENAME TO ix_guidelines_project_id_created_at"
+    )
+
+
+def upgrade():
+    _swap(['id', 'title'])
+
+
+def downgrade():
+    _swap([])
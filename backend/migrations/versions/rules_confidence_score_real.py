@@ -0,0 +1,41 @@
+"""Store rules.confidence_score as REAL
+
+Revision ID: rules_confidence_score_real
+Revises: add_uuid_server_defaults
+Create Date: 2026-10-16
+
+confidence_score is an LLM extraction confidence in [0, 1], not a monetary
+value; NUMERIC(3,2) made every read materialize a Python Decimal. REAL
+(float4) is ample precision for a confidence and reads back as a float.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'rules_confidence_score_real'
+down_revision = 'add_uuid_server_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'rules',
+        'confidence_score',
+        type_=sa.REAL(),
+        existing_type=sa.Numeric(precision=3, scale=2),
+        existing_nullable=True,
+        postgresql_using='confidence_score::real'
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'rules',
+        'confidence_score',
+        type_=sa.Numeric(precision=3, scale=2),
+        existing_type=sa.REAL(),
+        existing_nullable=True,
+        postgresql_using='round(confidence_score::numeric, 2)'
+    )
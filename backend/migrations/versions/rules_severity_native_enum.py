@@ -0,0 +1,54 @@
+"""Store rules.severity as a native rule_severity enum
+
+Revision ID: rules_severity_native_enum
+Revises: add_newest_first_listing_ix
+Create Date: 2026-10-16
+
+severity only ever holds critical/high/medium/low. A native enum is a
+4-byte value instead of a varchar, narrowing every rules row (read on each
+analysis) and the ix_rules_severity index. Existing values are lower-cased
+and anything unrecognised becomes 'medium' (the application default)
+before the type change, so the cast cannot fail.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'rules_severity_native_enum'
+down_revision = 'add_newest_first_listing_ix'
+branch_labels = None
+depends_on = None
+
+
+rule_severity = postgresql.ENUM('critical', 'high', 'medium', 'low', name='rule_severity')
+
+
+def upgrade():
+    rule_severity.create(op.get_bind(), checkfirst=True)
+    op.execute("UPDATE rules SET severity = lower(trim(severity))")
+    op.execute(
+        "UPDATE rules SET severity = 'medium' "
+        "WHERE severity NOT IN ('critical', 'high', 'medium', 'low')"
+    )
+    op.alter_column(
+        'rules',
+        'severity',
+        type_=rule_severity,
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using='severity::rule_severity'
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'rules',
+        'severity',
+        type_=sa.String(length=20),
+        existing_type=rule_severity,
+        existing_nullable=False,
+        postgresql_using='severity::text'
+    )
+    rule_severity.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,178 @@
+"""
+Unit tests for the deep analysis AI result cache.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services import deep_analysis_service as das
+from app.services.llm_service import llm_service
+
+RULES_PAYLOAD = ([], b"rules-digest")
+
+
+def _completion(content: str) -> Mock:
+    """Minimal stand-in for an OpenAI chat completion."""
+    completion = Mock()
+    completion.choices = [Mock()]
+    completion.choices[0].message.content = content
+    return completion
+
+
+@pytest.fixture(autouse=True)
+def clear_ai_cache():
+    das._AI_RESULT_CACHE.clear()
+    yield
+    das._AI_RESULT_CACHE.clear()
+    das._AI_IN_FLIGHT.clear()
+
+
+@pytest.mark.asyncio
+async def test_failed_llm_call_is_not_cached():
+    """A failed LLM call must not be cached as a clean line; the retry reaches the LLM."""
+    service = das.DeepAnalysisService()
+    good_reply = _completion(
+        '{"relevance_context": "pricing claim", '
+        '"violations": [{"rule_id": "r1", "severity": "high", "reason": "x"}]}'
+    )
+    create = AsyncMock(side_effect=[RuntimeError("LLM unavailable"), good_reply])
+
+    with patch.object(llm_service.client.chat.completions, "create", create), \
+            patch.object(llm_service, "_log_to_json", AsyncMock()):
+        first = await service.detect_violations_with_ai(
+            "Guaranteed 20% returns", 1, "Brochure", [], rules_payload=RULES_PAYLOAD
+        )
+        second = await service.detect_violations_with_ai(
+            "Guaranteed 20% returns", 1, "Brochure", [], rules_payload=RULES_PAYLOAD
+        )
+
+    assert first["success"] is False
+    assert create.await_count == 2
+    assert second["success"] is True
+    assert len(second["violations"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_unparseable_reply_is_not_cached():
+    """A reply without a JSON analysis is retried instead of cached."""
+    service = das.DeepAnalysisService()
+    create = AsyncMock(return_value=_completion("Sorry, I cannot help with that."))
+
+    with patch.object(llm_service.client.chat.completions, "create", create), \
+            patch.object(llm_service, "_log_to_json", AsyncMock()):
+        for _ in range(2):
+            result = await service.detect_violations_with_ai(
+                "Some line", 1, "Brochure", [], rules_payload=RULES_PAYLOAD
+            )
+            assert result["success"] is False
+
+    assert create.await_count == 2
+    assert len(das._AI_RESULT_CACHE) == 0
+
+
+@pytest.mark.asyncio
+async def test_successful_result_is_cached():
+    """A successful classification is served from the cache on repeat."""
+    service = das.DeepAnalysisService()
+    create = AsyncMock(return_value=_completion('{"relevance_context": "c", "violations": []}'))
+
+    with patch.object(llm_service.client.chat.completions, "create", create), \
+            patch.object(llm_service, "_log_to_json", AsyncMock()):
+        for _ in range(2):
+            await service.detect_violations_with_ai(
+                "Clean line", 1, "Brochure", [], rules_payload=RULES_PAYLOAD
+            )
+
+    assert create.await_count == 1
+
+
+SUCCESS = {"success": True, "relevance_context": "c", "violations": []}
+
+
+def _blocking_llm(release: asyncio.Event, first_outcome):
+    """LLM stand-in whose first call blocks until `release` is set, then returns/raises `first_outcome`."""
+    calls = []
+
+    async def analyze_line_for_violations(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            await release.wait()
+            if isinstance(first_outcome, BaseException):
+                raise first_outcome
+            return first_outcome
+        return SUCCESS
+
+    return analyze_line_for_violations, calls
+
+
+async def _classify(service):
+    return await service.detect_violations_with_ai(
+        "Repeated disclaimer", 1, "Brochure", [], rules_payload=RULES_PAYLOAD
+    )
+
+
+async def _start_owner_and_waiter(service):
+    """Start an owning classification, then a concurrent identical one that joins it."""
+    owner = asyncio.create_task(_classify(service))
+    await asyncio.sleep(0)
+    assert len(das._AI_IN_FLIGHT) == 1
+    waiter = asyncio.create_task(_classify(service))
+    await asyncio.sleep(0)
+    return owner, waiter
+
+
+@pytest.mark.asyncio
+async def test_waiter_classifies_itself_when_owner_is_cancelled():
+    """Cancelling the owning request must not cancel requests coalesced onto it."""
+    service = das.DeepAnalysisService()
+    analyze, calls = _blocking_llm(asyncio.Event(), SUCCESS)
+
+    with patch.object(das.llm_service, "analyze_line_for_violations", analyze):
+        owner, waiter = await _start_owner_and_waiter(service)
+        owner.cancel()
+
+        assert await waiter == SUCCESS
+
+    assert owner.cancelled()
+    assert len(calls) == 2
+    assert das._AI_IN_FLIGHT == {}
+
+
+@pytest.mark.asyncio
+async def test_owner_error_reaches_waiter():
+    """A failed shared call fails every request coalesced onto it, with one LLM call."""
+    service = das.DeepAnalysisService()
+    release = asyncio.Event()
+    analyze, calls = _blocking_llm(release, RuntimeError("LLM unavailable"))
+
+    with patch.object(das.llm_service, "analyze_line_for_violations", analyze):
+        owner, waiter = await _start_owner_and_waiter(service)
+        release.set()
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(calls) == 1
+    assert das._AI_IN_FLIGHT == {}
+    assert len(das._AI_RESULT_CACHE) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_owner_running():
+    """Cancelling a coalesced request must not cancel the shared LLM call."""
+    service = das.DeepAnalysisService()
+    release = asyncio.Event()
+    analyze, calls = _blocking_llm(release, SUCCESS)
+
+    with patch.object(das.llm_service, "analyze_line_for_violations", analyze):
+        owner, waiter = await _start_owner_and_waiter(service)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await owner == SUCCESS
+
+    assert waiter.cancelled()
+    assert len(calls) == 1
+    assert len(das._AI_RESULT_CACHE) == 1
@@ -0,0 +1,35 @@
+"""
+Unit tests for deep analysis orchestration.
+"""
+
+import threading
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.models.deep_analysis import DeepAnalysis
+from app.schemas.deep_analysis import SeverityWeights
+from app.services.deep_analysis_service import DeepAnalysisService
+
+
+@pytest.mark.asyncio
+async def test_response_is_read_off_the_event_loop_after_commit():
+    """The committed (expired) record must not be reloaded on the event loop."""
+    service = DeepAnalysisService()
+    submission = Mock(id=uuid.uuid4(), title="Brochure")
+    check = Mock(id=uuid.uuid4())
+    chunk = Mock(id=uuid.uuid4(), chunk_index=0, text="Guaranteed returns", token_count=3, metadata={})
+    threads = []
+
+    def to_response_dict(record, submission_id):
+        threads.append(threading.get_ident())
+        return {"submission_id": submission_id}
+
+    with patch.object(service, "_load_analysis_inputs", return_value=(submission, check, [], [chunk])), \
+            patch.object(service, "detect_violations_with_ai", AsyncMock(return_value={"violations": []})), \
+            patch.object(DeepAnalysis, "to_response_dict", to_response_dict):
+        result = await service.run_deep_analysis(submission.id, SeverityWeights(), Mock())
+
+    assert result == {"submission_id": str(submission.id)}
+    assert threads and threads[0] != threading.get_ident()
@@ -0,0 +1,29 @@
+"""
+Unit tests for authentication dependencies.
+"""
+
+import threading
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.api import deps
+
+
+@pytest.mark.asyncio
+async def test_first_seen_user_is_registered_off_the_event_loop():
+    deps._known_user_ids.clear()
+    db = Mock()
+    threads = []
+    db.execute.side_effect = lambda *args, **kwargs: threads.append(threading.get_ident())
+    service = Mock(verify_token_cached=AsyncMock(return_value=({"uid": "firebase-user"}, True)))
+
+    with patch.object(deps, "get_firebase_service", return_value=service):
+        user_id = await deps._ensure_user_id(authorization="Bearer token", db=db)
+
+    assert isinstance(user_id, uuid.UUID)
+    assert threads and threads[0] != threading.get_ident()
+    db.commit.assert_called_once()
+    assert user_id in deps._known_user_ids
+    deps._known_user_ids.clear()
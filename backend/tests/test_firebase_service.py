@@ -0,0 +1,45 @@
+"""
+Unit tests for Firebase token verification and its cache.
+"""
+
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from app.services import firebase_service as fs
+
+CLAIMS = {"sub": "firebase-user", "exp": int(time.time()) + 3600}
+
+
+@pytest.fixture
+def service():
+    fs._token_cache.clear()
+    yield fs.FirebaseService.__new__(fs.FirebaseService)  # Skip Admin SDK initialization
+    fs._token_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_unsigned_token_is_unverified_and_not_cached(service):
+    """The dev-fallback decode identifies the caller but never counts as verified."""
+    forged = jwt.encode(CLAIMS, key="", algorithm="none")
+
+    with patch.object(fs.auth, "verify_id_token", side_effect=ValueError("bad signature")):
+        decoded, verified = await service.verify_token_cached(forged)
+
+    assert decoded["uid"] == "firebase-user"
+    assert verified is False
+    assert len(fs._token_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_signed_token_is_verified_and_cached(service):
+    claims = {"uid": "firebase-user", "exp": CLAIMS["exp"]}
+
+    with patch.object(fs.auth, "verify_id_token", return_value=claims) as verify:
+        first = await service.verify_token_cached("signed-token")
+        second = await service.verify_token_cached("signed-token")
+
+    assert first == second == (claims, True)
+    verify.assert_called_once()
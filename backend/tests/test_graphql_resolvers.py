@@ -0,0 +1,98 @@
+"""
+Unit tests for GraphQL resolvers.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.graphql.resolvers import Resolvers
+
+USER_ID = uuid.uuid4()
+
+
+def _info(state: dict, session=None) -> Mock:
+    info = Mock()
+    info.context = {
+        "request": SimpleNamespace(state=SimpleNamespace(**state)),
+        "session": session or AsyncMock(),
+        "session_lock": asyncio.Lock(),
+    }
+    return info
+
+
+class TestCreateProject:
+    """Mutation.createProject authentication."""
+
+    @pytest.mark.asyncio
+    async def test_requires_authenticated_user(self):
+        info = _info({})
+
+        with pytest.raises(PermissionError):
+            await Resolvers.create_project(info, "Project")
+
+        info.context["session"].execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejects_unverified_header_identity(self):
+        info = _info({"user_id": str(USER_ID), "user_verified": False})
+
+        with pytest.raises(PermissionError):
+            await Resolvers.create_project(info, "Project")
+
+        info.context["session"].execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_user(self):
+        session = AsyncMock()
+        session.get.return_value = None
+        info = _info({"user_id": str(USER_ID), "user_verified": True}, session)
+
+        with pytest.raises(PermissionError):
+            await Resolvers.create_project(info, "Project")
+
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sets_creator_from_verified_user(self):
+        session = AsyncMock()
+        session.get.return_value = Mock()
+        project = Mock()
+        session.execute.return_value = Mock(scalar_one=Mock(return_value=project))
+        info = _info({"user_id": str(USER_ID), "user_verified": True}, session)
+
+        result = await Resolvers.create_project(info, "Project", "Desc")
+
+        assert result is project
+        statement = session.execute.await_args.args[0]
+        assert statement.compile().params["created_by"] == USER_ID
+        session.commit.assert_awaited_once()
+
+
+class TestDeleteProject:
+    """Mutation.deleteProject authorization."""
+
+    @pytest.mark.asyncio
+    async def test_requires_verified_user(self):
+        info = _info({"user_id": str(USER_ID), "user_verified": False})
+
+        with pytest.raises(PermissionError):
+            await Resolvers.delete_project(info, uuid.uuid4())
+
+        info.context["session"].execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deletes_only_own_project(self):
+        session = AsyncMock()
+        session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+        info = _info({"user_id": str(USER_ID), "user_verified": True}, session)
+        project_id = uuid.uuid4()
+
+        assert await Resolvers.delete_project(info, project_id) is False
+
+        params = session.execute.await_args.args[0].compile().params
+        assert project_id in params.values()
+        assert USER_ID in params.values()
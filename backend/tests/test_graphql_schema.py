@@ -0,0 +1,67 @@
+"""
+Tests for the GraphQL schema's nested project fields.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from strawberry.dataloader import DataLoader
+
+from app.graphql.schema import schema
+from app.models.project import Project
+from app.models.rule import Rule
+from app.models.submission import Submission
+
+NESTED_QUERY = """
+{
+  projects {
+    name
+    submissions { id filename status }
+    rules { id title category severity isActive }
+  }
+}
+"""
+
+
+def _context(projects, submissions, rules) -> dict:
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=projects))))
+
+    async def by_project(rows, keys):
+        return [[row for row in rows if row.project_id == key] for key in keys]
+
+    return {
+        "session": session,
+        "session_lock": asyncio.Lock(),
+        "submissions_by_project": DataLoader(load_fn=lambda keys: by_project(submissions, keys)),
+        "rules_by_project": DataLoader(load_fn=lambda keys: by_project(rules, keys)),
+    }
+
+
+@pytest.mark.asyncio
+async def test_nested_project_fields_resolve_from_orm_rows():
+    project = Project(id=uuid.uuid4(), name="Launch")
+    submission = Submission(
+        id=uuid.uuid4(), title="brochure.html", content_type="html",
+        status="analyzed", project_id=project.id
+    )
+    rule = Rule(
+        id=uuid.uuid4(), category="irdai", rule_text="No guaranteed returns",
+        severity="high", is_active=True, project_id=project.id
+    )
+
+    result = await schema.execute(
+        NESTED_QUERY, context_value=_context([project], [submission], [rule])
+    )
+
+    assert result.errors is None
+    [project_data] = result.data["projects"]
+    assert project_data["submissions"] == [
+        {"id": str(submission.id), "filename": "brochure.html", "status": "analyzed"}
+    ]
+    assert project_data["rules"] == [{
+        "id": str(rule.id), "title": "No guaranteed returns",
+        "category": "irdai", "severity": "high", "isActive": True
+    }]
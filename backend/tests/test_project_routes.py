@@ -0,0 +1,94 @@
+"""
+Integration tests for project guideline upload routes.
+"""
+
+import hashlib
+import os
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user_id
+from app.database import get_db
+from app.main import app
+
+USER_ID = uuid.uuid4()
+PROJECT_ID = uuid.uuid4()
+CONTENT = b"Guideline text"
+CONTENT_HASH = hashlib.blake2b(CONTENT, digest_size=16).hexdigest()
+
+
+@pytest.fixture
+def upload_env(tmp_path):
+    """Route dependencies wired to mocks, with uploads stored under tmp_path."""
+    project = Mock(created_by=USER_ID)
+    project_dir = tmp_path / str(PROJECT_ID)
+    project_dir.mkdir()
+    existing_path = project_dir / f"{CONTENT_HASH}.txt"
+    existing_path.write_bytes(CONTENT)
+    existing = Mock(id=uuid.uuid4(), title="guide.txt", file_path=str(existing_path))
+
+    db = Mock()
+    db.query.return_value.filter.return_value.first.return_value = existing
+
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user_id] = lambda: USER_ID
+    with patch("app.api.routes.projects.settings.upload_dir", str(tmp_path)), \
+            patch("app.api.routes.projects.ProjectService") as mock_service, \
+            patch("app.api.routes.projects.rule_generator_service") as mock_generator:
+        mock_service.return_value.get_project.return_value = project
+        mock_generator.generate_rules_from_document = AsyncMock(return_value={
+            "success": True, "rules_created": 4, "errors": []
+        })
+        yield db, existing, project_dir, mock_generator
+    app.dependency_overrides.clear()
+
+
+def _upload(filename: str):
+    client = TestClient(app)
+    return client.post(
+        f"/api/projects/{PROJECT_ID}/guidelines",
+        files={"file": (filename, CONTENT, "text/plain")},
+    )
+
+
+class TestDuplicateGuidelineUpload:
+    """Re-uploading a file the project already holds."""
+
+    def test_duplicate_with_rules_returns_original_outcome(self, upload_env):
+        db, existing, project_dir, mock_generator = upload_env
+        db.query.return_value.filter.return_value.one.return_value = (3, 2)
+
+        response = _upload("guide.txt")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["duplicate"] is True
+        assert body["rules_extracted"] == 2
+        mock_generator.generate_rules_from_document.assert_not_awaited()
+
+    def test_duplicate_without_rules_reruns_extraction(self, upload_env):
+        db, existing, project_dir, mock_generator = upload_env
+        db.query.return_value.filter.return_value.one.return_value = (0, 0)
+
+        response = _upload("guide.txt")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["duplicate"] is True
+        assert body["rules_extracted"] == 4
+        kwargs = mock_generator.generate_rules_from_document.await_args.kwargs
+        assert kwargs["file_path"] == existing.file_path
+        assert kwargs["document_title"] == existing.title
+
+    def test_duplicate_under_other_extension_removes_new_file(self, upload_env):
+        db, existing, project_dir, mock_generator = upload_env
+        db.query.return_value.filter.return_value.one.return_value = (1, 1)
+
+        response = _upload("guide.md")
+
+        assert response.status_code == 200
+        assert not (project_dir / f"{CONTENT_HASH}.md").exists()
+        assert os.path.exists(existing.file_path)
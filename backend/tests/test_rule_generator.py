@@ -260,3 +260,26 @@ async def test_rule_generation_end_to_end():
     # This would be implemented with actual DB and Ollama service
     # For now, it's a placeholder for future E2E testing
     pass
+
+
+class TestExtractedRuleSchema:
+    """Severity normalization of LLM-extracted rules."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        (" High ", "high"),
+        ("CRITICAL", "critical"),
+        ("urgent", "medium"),
+        (None, "medium"),
+    ])
+    def test_severity_is_normalized_with_medium_fallback(self, raw, expected):
+        from app.schemas.rule_extraction_schema import RuleExtractionResult
+
+        result = RuleExtractionResult(rules=[{
+            "rule_text": "No guaranteed returns",
+            "severity": raw,
+            "keywords": ["guaranteed"],
+            "points_deduction": -5.0,
+            "confidence_score": 0.9,
+        }])
+
+        assert result.rules[0].severity == expected
@@ -0,0 +1,154 @@
+"""
+Integration tests for submission routes.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from app.api.routes import submissions as submission_routes
+from app.database import get_db
+from app.main import app
+
+SUBMISSION_ID = uuid.uuid4()
+
+
+@pytest.fixture
+def mock_db():
+    db = Mock()
+    app.dependency_overrides[get_db] = lambda: db
+    yield db
+    app.dependency_overrides.clear()
+
+
+def _submission_row(submitted_at: datetime):
+    submission = SimpleNamespace(
+        id=uuid.uuid4(), title="Brochure", content_type="html",
+        status="analyzed", submitted_at=submitted_at
+    )
+    return submission, False
+
+
+def _list_submissions(rows: list, **params):
+    """
+    Run list_submissions on a real (unbound) Session, returning its response and SQL.
+
+    Query.all is intercepted so the query is built exactly as in production but
+    compiled instead of executed.
+    """
+    captured = {}
+
+    def fake_all(query):
+        captured["sql"] = str(query.statement.compile(dialect=postgresql.dialect()))
+        return rows
+
+    response = Response()
+    params = {"skip": 0, "limit": 50, "project_id": None, "cursor": None, **params}
+    with patch.object(Query, "all", autospec=True, side_effect=fake_all):
+        result = submission_routes.list_submissions(response=response, db=Session(), **params)
+    return result, response, captured["sql"]
+
+
+class TestListSubmissionsPaging:
+    """GET /api/submissions keyset cursor."""
+
+    def test_offset_page_builds_valid_query(self):
+        submitted_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        rows = [_submission_row(submitted_at) for _ in range(2)]
+
+        result, response, sql = _list_submissions(rows, skip=5, limit=2)
+
+        assert len(result) == 2
+        assert "GROUP BY" in sql and "OFFSET" in sql
+        last_id = rows[-1][0].id
+        assert response.headers["X-Next-Cursor"] == f"{submitted_at.isoformat()}_{last_id}"
+
+    def test_cursor_mode_ignores_skip(self):
+        cursor = f"{datetime(2026, 1, 2, tzinfo=timezone.utc).isoformat()}_{uuid.uuid4()}"
+
+        result, response, sql = _list_submissions([], cursor=cursor, skip=5)
+
+        assert result == []
+        assert "OFFSET" not in sql
+        assert "(submissions.submitted_at, submissions.id) <" in sql
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_malformed_cursor_is_rejected(self):
+        with pytest.raises(HTTPException) as exc_info:
+            _list_submissions([], cursor="not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestBackgroundAnalysis:
+    """POST /analyze?background=true."""
+
+    def test_claims_submission_before_scheduling(self, mock_db):
+        mock_db.query.return_value.filter.return_value.first.return_value = Mock(status="uploaded")
+        update = mock_db.query.return_value.filter.return_value.update
+        update.return_value = 1
+        client = TestClient(app)
+
+        with patch.object(submission_routes, "_run_analysis_in_background", AsyncMock()) as run:
+            response = client.post(f"/api/submissions/{SUBMISSION_ID}/analyze?background=true")
+
+        assert response.status_code == 200
+        update.assert_called_once_with({"status": "analyzing"}, synchronize_session=False)
+        mock_db.commit.assert_called()
+        run.assert_awaited_once_with(SUBMISSION_ID, True)
+
+    def test_rejects_when_claim_lost(self, mock_db):
+        mock_db.query.return_value.filter.return_value.first.return_value = Mock(status="analyzed")
+        mock_db.query.return_value.filter.return_value.update.return_value = 0
+        client = TestClient(app)
+
+        with patch.object(submission_routes, "_run_analysis_in_background", AsyncMock()) as run:
+            response = client.post(f"/api/submissions/{SUBMISSION_ID}/analyze?background=true")
+
+        assert response.status_code == 400
+        run.assert_not_awaited()
+
+    def test_rejects_while_preprocessing(self, mock_db):
+        mock_db.query.return_value.filter.return_value.first.return_value = Mock(status="preprocessing")
+        client = TestClient(app)
+
+        response = client.post(f"/api/submissions/{SUBMISSION_ID}/analyze?background=true")
+
+        assert response.status_code == 400
+        mock_db.query.return_value.filter.return_value.update.assert_not_called()
+
+
+class TestRunAnalysis:
+    """The analysis runner used by both the inline and background paths."""
+
+    @pytest.mark.asyncio
+    async def test_missing_submission_is_skipped(self):
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = None
+
+        with patch.object(submission_routes, "compliance_engine") as engine:
+            engine.analyze_submission = AsyncMock()
+            await submission_routes._run_analysis(SUBMISSION_ID, db)
+
+        engine.analyze_submission.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_background_failure_marks_submission_failed(self):
+        db = Mock()
+        with patch.object(submission_routes, "SessionLocal", return_value=db), \
+                patch.object(submission_routes, "_run_analysis", AsyncMock(side_effect=RuntimeError("boom"))):
+            await submission_routes._run_analysis_in_background(SUBMISSION_ID, False)
+
+        db.rollback.assert_called_once()
+        db.query.return_value.filter.return_value.update.assert_called_once_with(
+            {"status": "failed"}, synchronize_session=False
+        )
+        db.commit.assert_called_once()
+        db.close.assert_called_once()
@@ -15,10 +15,6 @@ interface ProgressState {
     progress: number;
     currentIndex: number;
     totalLines: number;
-    currentLine?: {
-        line_number: number;
-        content: string;
-    };
     lastResult?: {
         line_number: number;
         content: string;
@@ -140,23 +136,14 @@ export const DeepAnalysisPanel: React.FC<Props> = ({ submissionId, onClose, onAn
                                 });
                             }
 
-                            if (data.status === 'processing') {
-                                setProgress(prev => ({
-                                    ...prev,
-                                    status: 'processing',
-                                    progress: data.progress,
-                                    currentIndex: data.current_index,
-                                    totalLines: data.total_lines,
-                                    currentLine: data.current_line
-                                }));
-                            }
-
+                            // Classified frames arrive in batches and carry the progress
                             if (data.status === 'classified') {
                                 setProgress(prev => ({
                                     ...prev,
                                     status: 'classified',
                                     progress: data.progress,
                                     currentIndex: data.current_index,
+                                    totalLines: data.total_lines,
                                     lastResult: data.last_result
                                 }));
 
@@ -317,7 +304,7 @@ export const DeepAnalysisPanel: React.FC<Props> = ({ submissionId, onClose, onAn
                         <div className="space-y-2">
                             <div className="flex justify-between text-sm">
                                 <span className="font-medium text-gray-700">
-                                    Analyzing line {progress.currentIndex} of {progress.totalLines}
+                                    {progress.currentIndex} of {progress.totalLines} lines classified
                                 </span>
                                 <span className="text-purple-600 font-bold">{progress.progress.toFixed(1)}%</span>
                             </div>
@@ -329,17 +316,16 @@ export const DeepAnalysisPanel: React.FC<Props> = ({ submissionId, onClose, onAn
                             </div>
                         </div>
 
-                        {/* Current Line Being Analyzed */}
-                        {progress.currentLine && (
+                        {/* Waiting for the first batch of classified lines */}
+                        {progress.status === 'started' && (
                             <div className="p-4 bg-blue-50 border border-blue-200 rounded-xl animate-pulse">
-                                <div className="flex items-center gap-2 mb-2">
+                                <div className="flex items-center gap-2">
                                     <svg className="w-4 h-4 text-blue-600 animate-spin" fill="none" viewBox="0 0 24 24">
                                         <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle>
                                         <path className="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4z"></path>
                                     </svg>
-                                    <span className="text-sm font-medium text-blue-700">Analyzing Line {progress.currentLine.line_number}...</span>
+                                    <span className="text-sm font-medium text-blue-700">Classifying {progress.totalLines} lines...</span>
                                 </div>
-                                <p className="text-sm text-blue-600 font-mono">{progress.currentLine.content}</p>
                             </div>
                         )}
 